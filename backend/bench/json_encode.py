@@ -0,0 +1,81 @@
+"""Compare response encoding time of Flask's default JSON provider and ours.
+
+Seeds a throwaway database, builds the large payloads (restaurant listing,
+a menu, an order history page) with the same loaders the endpoints use, then
+times how long each provider takes to turn them into a response body.
+
+    python -m bench.json_encode --orders 20000 --rounds 500
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+
+def time_encode(encode, payload, rounds):
+    encode(payload)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        encode(payload)
+    return (time.perf_counter() - start) / rounds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--restaurants', type=int, default=200)
+    parser.add_argument('--menu-items', type=int, default=50, help='menu items per restaurant')
+    parser.add_argument('--orders', type=int, default=5000)
+    parser.add_argument('--rounds', type=int, default=300)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='json-bench-')
+    os.environ['DATABASE_URL'] = f'sqlite:///{os.path.join(workdir, "bench.db")}'
+    try:
+        from flask.json.provider import DefaultJSONProvider
+        from app import (app, db, FastJSONProvider, Order, OrderItem, load_restaurants, load_menu,
+                         order_payload, migrate_db)
+        from bench.seed import seed
+
+        with app.app_context():
+            migrate_db()
+            data = seed(restaurants=args.restaurants, menu_items=args.menu_items,
+                        orders=args.orders, messages=0)
+            user_id = max(data['orders_by_user'], key=lambda u: len(data['orders_by_user'][u]))
+            orders = Order.query.filter_by(user_id=user_id).options(
+                db.joinedload(Order.restaurant),
+                db.selectinload(Order.order_items).joinedload(OrderItem.menu_item)
+            ).order_by(Order.created_at.desc()).limit(app.config['PAGE_SIZE_MAX']).all()
+            payloads = {
+                'restaurants': load_restaurants(),
+                'menu': load_menu(data['restaurant_ids'][0]),
+                'order history page': {'orders': [order_payload(o) for o in orders],
+                                       'next_cursor': None},
+            }
+
+            providers = {
+                'flask default': DefaultJSONProvider(app),
+                'stdlib compact': FastJSONProvider(app, use_orjson=False),
+                'orjson': FastJSONProvider(app),
+            }
+            if providers['orjson'].name != 'orjson':
+                del providers['orjson']
+                print('orjson is not installed, skipping it')
+
+            print(f'{"payload":22} {"provider":16} {"bytes":>9} {"us/encode":>10}')
+            for name, payload in payloads.items():
+                for label, provider in providers.items():
+                    encode = lambda obj: provider.response(obj).get_data()
+                    size = len(encode(payload))
+                    seconds = time_encode(encode, payload, args.rounds)
+                    print(f'{name:22} {label:16} {size:9d} {seconds * 1e6:10.1f}')
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""Measure login latency during a burst of concurrent logins.
+
+Starts the app on a threaded WSGI server against a throwaway database, then
+fires logins from many client threads at once while another thread keeps
+browsing the restaurant list, and reports login p50/p95/p99, how many logins
+were shed with 503, and how the unrelated endpoint held up. Run it with the
+default bounded hashing pool and with --unbounded (one hash per request
+thread, as hashing inline would behave) to compare.
+
+    python -m bench.login --concurrency 32 --logins 400
+    python -m bench.login --concurrency 32 --logins 400 --unbounded
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=int, default=20)
+    parser.add_argument('--logins', type=int, default=400)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--hash-workers', type=int, help='PASSWORD_HASH_WORKERS')
+    parser.add_argument('--max-pending', type=int, help='PASSWORD_HASH_MAX_PENDING')
+    parser.add_argument('--unbounded', action='store_true',
+                        help='one hashing worker per client thread and no admission limit')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='login-bench-')
+    os.environ['DATABASE_URL'] = f'sqlite:///{os.path.join(workdir, "bench.db")}'
+    os.environ['METRICS_ENABLED'] = '0'
+    if args.unbounded:
+        os.environ['PASSWORD_HASH_WORKERS'] = str(args.concurrency)
+        os.environ['PASSWORD_HASH_MAX_PENDING'] = str(args.logins)
+        os.environ['PASSWORD_HASH_WAIT_SECONDS'] = '3600'
+    if args.hash_workers:
+        os.environ['PASSWORD_HASH_WORKERS'] = str(args.hash_workers)
+    if args.max_pending is not None:
+        os.environ['PASSWORD_HASH_MAX_PENDING'] = str(args.max_pending)
+    try:
+        import app as app_module
+        from bench.run import WSGITransport, percentile
+
+        with app_module.app.app_context():
+            app_module.migrate_db()
+            app_module.db.session.execute(app_module.db.insert(app_module.User), [{
+                'username': f'login_user_{i}',
+                'password': app_module.hash_password(f'password{i}'),
+                'display_name': f'ผู้ใช้ {i}'
+            } for i in range(args.users)])
+            app_module.db.session.commit()
+
+        transport = WSGITransport(app_module)
+        login_latencies = []
+        statuses = {}
+        browse_latencies = []
+        lock = threading.Lock()
+        done = threading.Event()
+
+        def login(n):
+            i = n % args.users
+            start = time.perf_counter()
+            status, _, _ = transport.request('POST', '/api/login', 0,
+                                             {'username': f'login_user_{i}', 'password': f'password{i}'})
+            elapsed = time.perf_counter() - start
+            with lock:
+                statuses[status] = statuses.get(status, 0) + 1
+                if status == 200:
+                    login_latencies.append(elapsed)
+
+        def browse():
+            while not done.is_set():
+                start = time.perf_counter()
+                transport.request('GET', '/api/restaurants', 1)
+                browse_latencies.append(time.perf_counter() - start)
+                time.sleep(0.01)
+
+        browser = threading.Thread(target=browse)
+        browser.start()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            list(pool.map(login, range(args.logins)))
+        duration = time.perf_counter() - start
+        done.set()
+        browser.join()
+        transport.close()
+
+        hasher = app_module.password_hasher
+        print(f'{args.logins} logins from {args.concurrency} threads in {duration:.1f}s, '
+              f'hash workers={hasher.workers}, statuses={dict(sorted(statuses.items()))}')
+        for label, latencies in (('login (200)', login_latencies), ('GET /api/restaurants', browse_latencies)):
+            latencies.sort()
+            if latencies:
+                print(f'  {label:22} n={len(latencies):5d} p50={percentile(latencies, 50) * 1000:8.1f}ms '
+                      f'p95={percentile(latencies, 95) * 1000:8.1f}ms p99={percentile(latencies, 99) * 1000:8.1f}ms')
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""Show SQLite query plans for the hot lookups before and after migrate_db.
+
+Copies a database file (the bundled instance/food_delivery.db by default),
+prints EXPLAIN QUERY PLAN for each hot query, applies the migration to the
+copy and prints the plans again, so the original file is never touched.
+
+    python -m bench.query_plans [path/to/food_delivery.db]
+"""
+import os
+import shutil
+import sys
+import tempfile
+
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import migrate_db  # noqa: E402
+
+DEFAULT_DB = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                          'instance', 'food_delivery.db')
+
+HOT_QUERIES = [
+    ('cart by user', 'SELECT * FROM cart_item WHERE user_id = 1'),
+    ('cart item exists', 'SELECT * FROM cart_item WHERE user_id = 1 AND menu_item_id = 2'),
+    ('order history page', 'SELECT * FROM "order" WHERE user_id = 1 '
+                           'ORDER BY created_at DESC, id DESC LIMIT 21'),
+    ('owner order queue', 'SELECT * FROM "order" WHERE restaurant_id = 1 AND status = \'pending\' '
+                          'AND created_at >= \'2024-01-01\' ORDER BY created_at, id LIMIT 21'),
+    ('order items', 'SELECT * FROM order_item WHERE order_id IN (1, 2, 3)'),
+    ('message thread page', 'SELECT * FROM message WHERE order_id = 1 '
+                            'ORDER BY created_at DESC, id DESC LIMIT 21'),
+    ('unread count', 'SELECT order_id, count(*) FROM message '
+                     'WHERE receiver_id = 1 AND is_read = 0 GROUP BY order_id'),
+    ('daily sales', 'SELECT * FROM restaurant_daily_sales WHERE restaurant_id = 1 '
+                    'AND day BETWEEN \'2024-01-01\' AND \'2024-01-30\''),
+    ('top items', 'SELECT menu_item_id, sum(quantity) FROM menu_item_daily_sales '
+                  'WHERE restaurant_id = 1 AND day BETWEEN \'2024-01-01\' AND \'2024-01-30\' '
+                  'GROUP BY menu_item_id'),
+    ('menu', 'SELECT * FROM menu_item WHERE restaurant_id = 1 AND is_available = 1'),
+    ('active restaurants', 'SELECT * FROM restaurant WHERE is_active = 1'),
+    ('open restaurants', 'SELECT id FROM restaurant WHERE is_active = 1 AND ('
+                         '(open_minute < close_minute AND open_minute <= 600 AND close_minute > 600) '
+                         'OR (open_minute > close_minute AND (open_minute <= 600 OR close_minute > 600)) '
+                         'OR open_minute = close_minute)'),
+]
+
+
+def explain(engine):
+    plans = {}
+    with engine.connect() as conn:
+        for name, sql in HOT_QUERIES:
+            try:
+                rows = conn.exec_driver_sql('EXPLAIN QUERY PLAN ' + sql).all()
+            except OperationalError as exc:
+                # e.g. a column the migration has not added yet
+                plans[name] = [f'not available ({exc.orig})']
+                continue
+            plans[name] = [row[-1] for row in rows]
+    return plans
+
+
+def main(argv):
+    source = argv[1] if len(argv) > 1 else DEFAULT_DB
+    workdir = tempfile.mkdtemp(prefix='query-plans-')
+    try:
+        path = os.path.join(workdir, 'plans.db')
+        shutil.copyfile(source, path)
+        engine = create_engine(f'sqlite:///{path}')
+
+        before = explain(engine)
+        migrate_db(engine)
+        after = explain(engine)
+        engine.dispose()
+
+        for name, _ in HOT_QUERIES:
+            print(name)
+            print('  before: ' + ' | '.join(before[name]))
+            print('  after:  ' + ' | '.join(after[name]))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main(sys.argv)
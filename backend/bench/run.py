@@ -0,0 +1,423 @@
+"""Load-test the Flask API and record per-endpoint latency and SQL counts.
+
+Seeds a throwaway SQLite database with a synthetic dataset, then drives a
+realistic request mix (browse, add to cart, checkout, chat polling, order
+history) through the Flask test client, a real threaded WSGI server, and/or
+the pre-forking `app.py serve` server at several worker counts.
+Reports p50/p95/p99 latency, throughput and SQL statements per request for
+every endpoint, and writes everything to a JSON file so runs on different
+commits can be compared.
+
+    python -m bench.run --orders 20000 --messages 50000 --requests 3000
+    python -m bench.run --mode wsgi --concurrency 16 --output after.json --compare before.json
+    python -m bench.run --check-sql   # exit 1 if an endpoint exceeds its statement budget
+    python -m bench.run --mode workers --workers 1,2,4 --concurrency 16   # multi-process scaling
+"""
+import argparse
+import http.client
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+# Upper bound on SQL statements per request, enforced by --check-sql. Keeps
+# N+1 regressions (e.g. per-row lazy loads) from creeping back in.
+STATEMENT_BUDGETS = {
+    'GET /api/check-auth': 1,  # 0 once the user's summary is cached
+    'GET /api/restaurants': 2,
+    'GET /api/restaurants/<id>': 3,
+    'GET /api/restaurants/<id>/menu': 3,
+    'GET /api/cart': 1,
+    'POST /api/cart': 5,
+    'POST /api/orders': 10,  # incl. 2 sales rollup upserts; the same for any number of restaurants in the cart
+    'GET /api/orders/history': 4,
+    'GET /api/messages/<id>': 6,
+}
+
+# Relative weights of user journeys in the mix
+SCENARIO_WEIGHTS = {
+    'browse': 50,
+    'add_to_cart': 15,
+    'checkout': 5,
+    'chat_poll': 20,
+    'history': 10,
+}
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(pct / 100.0 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[rank]
+
+
+class Recorder:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.samples = {}
+
+    def add(self, endpoint, seconds, status, statements=None):
+        with self._lock:
+            sample = self.samples.setdefault(endpoint, {'latencies': [], 'errors': 0, 'statements': []})
+            sample['latencies'].append(seconds)
+            if status >= 400 and status != 409:
+                sample['errors'] += 1
+            if statements is not None:
+                sample['statements'].append(statements)
+
+    def summary(self, duration):
+        endpoints = {}
+        total = 0
+        for endpoint, sample in sorted(self.samples.items()):
+            latencies = sorted(sample['latencies'])
+            total += len(latencies)
+            stats = {
+                'count': len(latencies),
+                'errors': sample['errors'],
+                'mean_ms': round(sum(latencies) / len(latencies) * 1000, 3),
+                'p50_ms': round(percentile(latencies, 50) * 1000, 3),
+                'p95_ms': round(percentile(latencies, 95) * 1000, 3),
+                'p99_ms': round(percentile(latencies, 99) * 1000, 3),
+            }
+            if sample['statements']:
+                stats['sql_per_request_mean'] = round(sum(sample['statements']) / len(sample['statements']), 2)
+                stats['sql_per_request_max'] = max(sample['statements'])
+            endpoints[endpoint] = stats
+        return {
+            'duration_s': round(duration, 3),
+            'requests': total,
+            'throughput_rps': round(total / duration, 1) if duration else 0.0,
+            'endpoints': endpoints,
+        }
+
+
+class TestClientTransport:
+    # Requests run in the calling thread, so a thread-local counter on the
+    # engine attributes every SQL statement to the request that issued it
+    def __init__(self, app_module):
+        from sqlalchemy import event
+
+        self.app = app_module.app
+        self.local = threading.local()
+        with self.app.app_context():
+            engine = app_module.db.engine
+
+        @event.listens_for(engine, 'before_cursor_execute')
+        def count_statement(*args, **kwargs):
+            if getattr(self.local, 'counting', False):
+                self.local.statements += 1
+
+    def request(self, method, path, user_id, body=None):
+        client = getattr(self.local, 'client', None)
+        if client is None:
+            client = self.local.client = self.app.test_client()
+        self.local.statements = 0
+        self.local.counting = True
+        try:
+            response = client.open(path, method=method, json=body,
+                                   headers={'X-User-Id': str(user_id)})
+            data = response.get_json(silent=True)
+        finally:
+            self.local.counting = False
+        return response.status_code, data, self.local.statements
+
+
+class HTTPTransport:
+    # Real sockets against a server on localhost; SQL counts are not
+    # attributable per request here, so only latency is recorded
+    def __init__(self, port):
+        self.port = port
+        self.local = threading.local()
+
+    def request(self, method, path, user_id, body=None):
+        headers = {'X-User-Id': str(user_id)}
+        payload = None
+        if body is not None:
+            payload = json.dumps(body)
+            headers['Content-Type'] = 'application/json'
+        for attempt in range(2):
+            connection = getattr(self.local, 'connection', None)
+            if connection is None:
+                connection = self.local.connection = http.client.HTTPConnection('127.0.0.1', self.port)
+            try:
+                connection.request(method, path, body=payload, headers=headers)
+                response = connection.getresponse()
+                raw = response.read()
+                break
+            except (http.client.HTTPException, OSError):
+                connection.close()
+                self.local.connection = None
+                if attempt:
+                    raise
+        try:
+            data = json.loads(raw) if raw else None
+        except ValueError:
+            data = None
+        return response.status, data, None
+
+
+class WSGITransport(HTTPTransport):
+    # werkzeug's threaded server running in this process
+    def __init__(self, app_module):
+        from werkzeug.serving import make_server
+
+        self.server = make_server('127.0.0.1', 0, app_module.app, threaded=True,
+                                  request_handler=app_module.QuietRequestHandler)
+        super().__init__(self.server.server_port)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def close(self):
+        self.server.shutdown()
+
+
+class ServerProcessTransport(HTTPTransport):
+    # `app.py serve` in a child process with the given number of workers,
+    # sharing this process's DATABASE_URL and cache settings
+    def __init__(self, workers):
+        self.process = subprocess.Popen(
+            [sys.executable, os.path.join(BACKEND_DIR, 'app.py'), 'serve', '--port', '0',
+             '--workers', str(workers), '--no-access-log'],
+            cwd=BACKEND_DIR, stdout=subprocess.PIPE, text=True)
+        line = self.process.stdout.readline()
+        if not line.startswith('Serving on '):
+            self.process.kill()
+            raise RuntimeError(f'server did not start: {line!r}')
+        super().__init__(int(line.split()[2].rsplit(':', 1)[1]))
+
+    def close(self):
+        self.process.terminate()
+        self.process.wait(timeout=30)
+
+
+class LoadGenerator:
+    def __init__(self, transport, recorder, dataset, rng):
+        self.transport = transport
+        self.recorder = recorder
+        self.dataset = dataset
+        self.rng = rng
+        self.scenarios = [(getattr(self, name), weight) for name, weight in SCENARIO_WEIGHTS.items()]
+
+    def call(self, endpoint, method, path, user_id, body=None):
+        start = time.perf_counter()
+        status, data, statements = self.transport.request(method, path, user_id, body)
+        self.recorder.add(endpoint, time.perf_counter() - start, status, statements)
+        return status, data
+
+    def run_one(self, rng):
+        functions, weights = zip(*self.scenarios)
+        rng.choices(functions, weights)[0](rng)
+
+    def browse(self, rng):
+        user_id = rng.choice(self.dataset['user_ids'])
+        restaurant_id = rng.choice(self.dataset['restaurant_ids'])
+        self.call('GET /api/check-auth', 'GET', '/api/check-auth', user_id)
+        self.call('GET /api/restaurants', 'GET', '/api/restaurants', user_id)
+        self.call('GET /api/restaurants/<id>', 'GET', f'/api/restaurants/{restaurant_id}', user_id)
+        self.call('GET /api/restaurants/<id>/menu', 'GET', f'/api/restaurants/{restaurant_id}/menu', user_id)
+
+    def add_items(self, rng, user_id, count):
+        restaurant_id = rng.choice(self.dataset['restaurant_ids'])
+        menu = self.dataset['menus'][restaurant_id]
+        for menu_item_id in rng.sample(menu, min(count, len(menu))):
+            self.call('POST /api/cart', 'POST', '/api/cart', user_id,
+                      {'menu_item_id': menu_item_id, 'quantity': rng.randint(1, 3)})
+
+    def add_to_cart(self, rng):
+        user_id = rng.choice(self.dataset['user_ids'])
+        self.add_items(rng, user_id, rng.randint(1, 3))
+        self.call('GET /api/cart', 'GET', '/api/cart', user_id)
+
+    def checkout(self, rng):
+        user_id = rng.choice(self.dataset['user_ids'])
+        self.add_items(rng, user_id, rng.randint(1, 4))
+        self.call('POST /api/orders', 'POST', '/api/orders', user_id, {})
+
+    def chat_poll(self, rng):
+        users = [u for u in self.dataset['orders_by_user']]
+        user_id = rng.choice(users)
+        order_id = rng.choice(self.dataset['orders_by_user'][user_id])
+        status, data = self.call('GET /api/messages/<id>', 'GET', f'/api/messages/{order_id}', user_id)
+        messages = (data or {}).get('messages') or []
+        if messages:
+            # Follow-up poll as the chat page does, asking only for new messages
+            self.call('GET /api/messages/<id>', 'GET',
+                      f'/api/messages/{order_id}?after_id={messages[-1]["id"]}', user_id)
+
+    def history(self, rng):
+        user_id = rng.choice(list(self.dataset['orders_by_user']))
+        status, data = self.call('GET /api/orders/history', 'GET', '/api/orders/history', user_id)
+        cursor = (data or {}).get('next_cursor')
+        if cursor and rng.random() < 0.3:
+            self.call('GET /api/orders/history', 'GET', f'/api/orders/history?cursor={cursor}', user_id)
+
+    def run(self, total, concurrency):
+        counter = {'left': total}
+        lock = threading.Lock()
+
+        def worker(worker_seed):
+            rng = random.Random(worker_seed)
+            while True:
+                with lock:
+                    if counter['left'] <= 0:
+                        return
+                    counter['left'] -= 1
+                self.run_one(rng)
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            for n in range(concurrency):
+                pool.submit(worker, self.rng.random() + n)
+        return time.perf_counter() - start
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', 'HEAD'], cwd=BACKEND_DIR,
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def check_budgets(results):
+    violations = []
+    for mode in results['modes'].values():
+        for endpoint, stats in mode['endpoints'].items():
+            budget = STATEMENT_BUDGETS.get(endpoint)
+            worst = stats.get('sql_per_request_max')
+            if budget is not None and worst is not None and worst > budget:
+                violations.append(f'{endpoint}: {worst} statements (budget {budget})')
+    return violations
+
+
+def compare(results, baseline):
+    print('\nComparison with baseline (p95 ms, throughput rps)')
+    for mode_name, mode in results['modes'].items():
+        base_mode = baseline.get('modes', {}).get(mode_name)
+        if not base_mode:
+            continue
+        print(f'[{mode_name}] throughput {base_mode["throughput_rps"]} -> {mode["throughput_rps"]}')
+        for endpoint, stats in mode['endpoints'].items():
+            base = base_mode['endpoints'].get(endpoint)
+            if not base or not base['p95_ms']:
+                continue
+            change = (stats['p95_ms'] - base['p95_ms']) / base['p95_ms'] * 100
+            print(f'  {endpoint:<34} {base["p95_ms"]:>9.2f} -> {stats["p95_ms"]:>9.2f}  ({change:+.1f}%)')
+
+
+def print_mode(name, summary):
+    print(f'\n[{name}] {summary["requests"]} requests in {summary["duration_s"]}s '
+          f'= {summary["throughput_rps"]} req/s')
+    print(f'  {"endpoint":<34} {"count":>6} {"p50":>8} {"p95":>8} {"p99":>8} {"sql":>6}')
+    for endpoint, stats in summary['endpoints'].items():
+        sql = stats.get('sql_per_request_mean', '-')
+        print(f'  {endpoint:<34} {stats["count"]:>6} {stats["p50_ms"]:>8.2f} '
+              f'{stats["p95_ms"]:>8.2f} {stats["p99_ms"]:>8.2f} {sql:>6}')
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--users', type=int, default=200)
+    parser.add_argument('--restaurants', type=int, default=100)
+    parser.add_argument('--menu-items', type=int, default=20, help='menu items per restaurant')
+    parser.add_argument('--orders', type=int, default=5000)
+    parser.add_argument('--messages', type=int, default=20000)
+    parser.add_argument('--requests', type=int, default=2000, help='user journeys per mode')
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--mode', choices=['client', 'wsgi', 'both', 'workers'], default='both')
+    parser.add_argument('--workers', default='1,2,4',
+                        help='comma-separated worker counts for --mode workers')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--no-cache', action='store_true', help='disable the catalog cache')
+    parser.add_argument('--output', default=os.path.join(BACKEND_DIR, 'bench', 'results', 'latest.json'))
+    parser.add_argument('--compare', help='previous results JSON to compare against')
+    parser.add_argument('--check-sql', action='store_true',
+                        help='exit non-zero if an endpoint exceeds its SQL statement budget')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    workdir = tempfile.mkdtemp(prefix='bench-')
+    # The app reads its configuration at import time
+    os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(workdir, 'bench.db')
+    if args.no_cache:
+        os.environ['CATALOG_CACHE_ENABLED'] = '0'
+
+    try:
+        import app as app_module
+        from bench.seed import seed
+
+        with app_module.app.app_context():
+            app_module.migrate_db()
+            started = time.perf_counter()
+            dataset = seed(users=args.users, restaurants=args.restaurants, menu_items=args.menu_items,
+                           orders=args.orders, messages=args.messages, seed_value=args.seed)
+            app_module.migrate_db()
+            print(f'Seeded dataset in {time.perf_counter() - started:.1f}s')
+
+        results = {
+            'meta': {
+                'timestamp': datetime.utcnow().isoformat(),
+                'commit': git_commit(),
+                'python': platform.python_version(),
+                'config': {key: value for key, value in vars(args).items()
+                           if key not in ('output', 'compare')},
+            },
+            'modes': {},
+        }
+
+        if args.mode == 'workers':
+            modes = [f'workers={int(n)}' for n in args.workers.split(',')]
+        else:
+            modes = ['client', 'wsgi'] if args.mode == 'both' else [args.mode]
+        for mode in modes:
+            if mode == 'client':
+                transport = TestClientTransport(app_module)
+            elif mode == 'wsgi':
+                transport = WSGITransport(app_module)
+            else:
+                transport = ServerProcessTransport(int(mode.split('=')[1]))
+            recorder = Recorder()
+            generator = LoadGenerator(transport, recorder, dataset, random.Random(args.seed))
+            try:
+                duration = generator.run(args.requests, args.concurrency)
+            finally:
+                if mode != 'client':
+                    transport.close()
+            summary = recorder.summary(duration)
+            results['modes'][mode] = summary
+            print_mode(mode, summary)
+
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as fh:
+            json.dump(results, fh, indent=2, ensure_ascii=False)
+        print(f'\nResults written to {args.output}')
+
+        if args.compare:
+            with open(args.compare, encoding='utf-8') as fh:
+                compare(results, json.load(fh))
+
+        if args.check_sql:
+            violations = check_budgets(results)
+            for violation in violations:
+                print('SQL budget exceeded: ' + violation)
+            return 1 if violations else 0
+        return 0
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
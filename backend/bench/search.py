@@ -0,0 +1,71 @@
+"""Measure /api/search latency on a large synthetic catalog.
+
+Seeds a throwaway database (100k menu items by default), then times the
+search endpoint through the Flask test client for a mix of common, rare and
+short queries and reports p50/p95/max per query.
+
+    python -m bench.search --restaurants 1000 --menu-items 100 --rounds 50
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from urllib.parse import quote
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+QUERIES = [
+    ('common term', 'ข้าว', 'all'),
+    ('two terms', 'ข้าว กระเพรา', 'menu_items'),
+    ('rare term', 'เกี๊ยวน้ำ 7', 'menu_items'),
+    ('restaurant location', 'โรงอาหาร', 'restaurants'),
+    ('description', 'ทดสอบ', 'menu_items'),
+    ('no match', 'พิซซ่า', 'all'),
+    ('short term (LIKE)', 'ไก', 'menu_items'),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--restaurants', type=int, default=1000)
+    parser.add_argument('--menu-items', type=int, default=100, help='menu items per restaurant')
+    parser.add_argument('--rounds', type=int, default=50)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='search-bench-')
+    os.environ['DATABASE_URL'] = f'sqlite:///{os.path.join(workdir, "bench.db")}'
+    try:
+        from app import app, migrate_db
+        from bench.run import percentile
+        from bench.seed import seed
+
+        with app.app_context():
+            migrate_db()
+            start = time.perf_counter()
+            seed(restaurants=args.restaurants, menu_items=args.menu_items, orders=0, messages=0)
+            print(f'Seeded {args.restaurants * args.menu_items} menu items in '
+                  f'{time.perf_counter() - start:.1f}s')
+
+        client = app.test_client()
+        print(f'{"query":22} {"type":12} {"hits":>5} {"p50 ms":>8} {"p95 ms":>8} {"max ms":>8}')
+        for label, text, kind in QUERIES:
+            url = f'/api/search?q={quote(text)}&type={kind}'
+            latencies = []
+            for _ in range(args.rounds):
+                start = time.perf_counter()
+                response = client.get(url)
+                latencies.append((time.perf_counter() - start) * 1000)
+            data = response.get_json()
+            hits = sum(len(section['results']) for section in data.values())
+            latencies.sort()
+            print(f'{label:22} {kind:12} {hits:5d} {percentile(latencies, 50):8.2f} '
+                  f'{percentile(latencies, 95):8.2f} {latencies[-1]:8.2f}')
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+"""Seed a synthetic dataset for benchmarks.
+
+Creates users, restaurants with menus, orders with items and chat messages
+with bulk inserts, well beyond the handful of rows init_db creates. Must be
+called inside an app context; returns the ids the load generator needs.
+"""
+import random
+from datetime import datetime, timedelta
+
+from app import (db, hash_password, minute_of_day, rebuild_sales_rollups, User, Restaurant,
+                 MenuItem, Order, OrderItem, Message)
+
+CHUNK = 5000
+
+LOCATIONS = ['ตลาดมหาวิทยาลัย', 'หน้าโรงเรียน', 'ถนนพหลโยธิน', 'โรงอาหารกลาง', 'หน้าตึก IT']
+DISHES = ['ข้าวแกงเขียวหวาน', 'ข้าวผัดกระเพรา', 'ก๋วยเตี๋ยวต้มยำ', 'ส้มตำไทย', 'ไก่ย่าง',
+          'ลาบหมู', 'ข้าวมันไก่', 'ผัดไทย', 'ข้าวหมูแดง', 'เกี๊ยวน้ำ']
+STATUSES = ['pending', 'confirmed', 'completed', 'cancelled']
+
+
+def insert_chunked(model, rows):
+    for start in range(0, len(rows), CHUNK):
+        db.session.execute(db.insert(model), rows[start:start + CHUNK])
+
+
+def seed(users=200, restaurants=100, menu_items=20, orders=5000, messages=20000,
+         days=180, seed_value=42):
+    rng = random.Random(seed_value)
+    now = datetime.utcnow()
+    # One hash for every account; hashing per user would dominate seeding time
+    password = hash_password('password')
+
+    insert_chunked(User, [{
+        'username': f'bench_user_{i}',
+        'password': password,
+        'display_name': f'ผู้ใช้ {i}'
+    } for i in range(users)])
+    user_ids = [row[0] for row in db.session.query(User.id)
+                .filter(User.username.like('bench_user_%')).order_by(User.id)]
+
+    owner_ids = user_ids[:max(1, len(user_ids) // 4)]
+    restaurant_rows = []
+    for i in range(restaurants):
+        open_hour = rng.randint(6, 12)
+        open_time = f'{open_hour:02d}:00'
+        close_time = f'{open_hour + rng.randint(4, 10):02d}:00'
+        # Bulk inserts skip the model's validators, so fill the minutes here
+        restaurant_rows.append({
+            'user_id': rng.choice(owner_ids),
+            'name': f'ร้าน {rng.choice(DISHES)} {i}',
+            'open_time': open_time,
+            'close_time': close_time,
+            'open_minute': minute_of_day(open_time),
+            'close_minute': minute_of_day(close_time),
+            'location': rng.choice(LOCATIONS),
+            'pickup_time': f'{rng.randint(11, 18):02d}:30',
+            'pickup_location': rng.choice(LOCATIONS),
+            'image_url': f'https://images.example.com/restaurant/{i}.jpg'
+        })
+    insert_chunked(Restaurant, restaurant_rows)
+    restaurant_rows = db.session.query(Restaurant.id, Restaurant.user_id) \
+        .filter(Restaurant.name.like('ร้าน %')).order_by(Restaurant.id).all()
+    restaurant_owner = dict(restaurant_rows)
+    restaurant_ids = list(restaurant_owner)
+
+    insert_chunked(MenuItem, [{
+        'restaurant_id': restaurant_id,
+        'name': f'{rng.choice(DISHES)} {n}',
+        'price': float(rng.randint(30, 120)),
+        'description': 'เมนูทดสอบ ' * rng.randint(1, 6),
+        'image_url': f'https://images.example.com/menu/{restaurant_id}/{n}.jpg',
+        'is_available': rng.random() > 0.1
+    } for restaurant_id in restaurant_ids for n in range(menu_items)])
+    menus = {}
+    for menu_id, restaurant_id, price, available in db.session.query(
+            MenuItem.id, MenuItem.restaurant_id, MenuItem.price, MenuItem.is_available) \
+            .filter(MenuItem.restaurant_id.in_(restaurant_ids)):
+        if available:
+            menus.setdefault(restaurant_id, []).append((menu_id, price))
+    restaurant_ids = [r for r in restaurant_ids if r in menus]
+
+    order_rows = []
+    order_lines = []
+    for _ in range(orders):
+        restaurant_id = rng.choice(restaurant_ids)
+        lines = rng.sample(menus[restaurant_id], min(len(menus[restaurant_id]), rng.randint(1, 4)))
+        lines = [(menu_id, price, rng.randint(1, 3)) for menu_id, price in lines]
+        order_rows.append({
+            'user_id': rng.choice(user_ids),
+            'restaurant_id': restaurant_id,
+            'total_price': sum(price * quantity for _, price, quantity in lines),
+            'status': rng.choice(STATUSES),
+            'pickup_time': '12:30',
+            'pickup_location': rng.choice(LOCATIONS),
+            'created_at': now - timedelta(seconds=rng.randint(0, days * 86400))
+        })
+        order_lines.append(lines)
+    order_ids = []
+    for start in range(0, len(order_rows), CHUNK):
+        order_ids.extend(db.session.scalars(
+            db.insert(Order).returning(Order.id, sort_by_parameter_order=True),
+            order_rows[start:start + CHUNK]
+        ))
+
+    insert_chunked(OrderItem, [{
+        'order_id': order_id,
+        'menu_item_id': menu_id,
+        'quantity': quantity,
+        'price': price,
+        'note': ''
+    } for order_id, lines in zip(order_ids, order_lines) for menu_id, price, quantity in lines])
+
+    message_rows = []
+    chat_orders = rng.sample(range(len(order_ids)), min(len(order_ids), max(1, messages // 10)))
+    for n in range(messages):
+        index = chat_orders[n % len(chat_orders)]
+        customer = order_rows[index]['user_id']
+        owner = restaurant_owner[order_rows[index]['restaurant_id']]
+        sender, receiver = (customer, owner) if rng.random() < 0.5 else (owner, customer)
+        message_rows.append({
+            'sender_id': sender,
+            'receiver_id': receiver,
+            'order_id': order_ids[index],
+            'content': f'ข้อความทดสอบ {n}',
+            'created_at': order_rows[index]['created_at'] + timedelta(seconds=n),
+            'is_read': rng.random() < 0.8
+        })
+    insert_chunked(Message, message_rows)
+    # Orders were inserted in bulk, outside create_order
+    rebuild_sales_rollups(db.session.connection())
+    db.session.commit()
+
+    orders_by_user = {}
+    for order_id, row in zip(order_ids, order_rows):
+        orders_by_user.setdefault(row['user_id'], []).append(order_id)
+    return {
+        'user_ids': user_ids,
+        'restaurant_ids': restaurant_ids,
+        'menus': {r: [menu_id for menu_id, _ in items] for r, items in menus.items()},
+        'orders_by_user': orders_by_user
+    }
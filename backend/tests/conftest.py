@@ -0,0 +1,69 @@
+"""Shared fixtures: the app against a throwaway SQLite database.
+
+app.py reads its configuration at import time, so DATABASE_URL is pointed at
+a temporary file before the module is imported. The database is created and
+seeded once per test session with init_db (user1..user5, restaurants 1-3
+owned by users 1-3); tests that write create their own rows or only touch
+rows no other test depends on.
+"""
+import os
+import shutil
+import sys
+import tempfile
+
+import pytest
+from sqlalchemy import event
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+WORKDIR = tempfile.mkdtemp(prefix='food-delivery-tests-')
+os.environ['DATABASE_URL'] = f'sqlite:///{os.path.join(WORKDIR, "test.db")}'
+os.environ['METRICS_ENABLED'] = '0'
+# Cheap hashes: the tests exercise the login flow, not the cost parameters
+os.environ['PASSWORD_SCRYPT_N'] = '16'
+
+import app as app_module  # noqa: E402
+
+
+@pytest.fixture(scope='session', autouse=True)
+def database():
+    app_module.init_db()
+    yield
+    with app_module.app.app_context():
+        app_module.db.engine.dispose()
+    shutil.rmtree(WORKDIR, ignore_errors=True)
+
+
+# No app context is held here: requests push their own, so per-request
+# state on flask.g does not leak from one request into the next. Use
+# app.app_context() around direct database access.
+@pytest.fixture
+def app():
+    app_module.catalog_cache.clear()
+    app_module.identity_cache.clear()
+    return app_module.app
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def statements(app):
+    """List of SQL statements run while the test holds it."""
+    executed = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    with app.app_context():
+        engine = app_module.db.engine
+    event.listen(engine, 'before_cursor_execute', record)
+    yield executed
+    event.remove(engine, 'before_cursor_execute', record)
+
+
+def auth(user_id):
+    return {'X-User-Id': str(user_id)}
@@ -0,0 +1,58 @@
+import hashlib
+
+import app as app_module
+
+
+def add_user(app, username, stored_password):
+    with app.app_context():
+        user = app_module.User(username=username, password=stored_password, display_name=username)
+        app_module.db.session.add(user)
+        app_module.db.session.commit()
+        return user.id
+
+
+def stored_password(app, user_id):
+    with app.app_context():
+        return app_module.db.session.get(app_module.User, user_id).password
+
+
+def login(client, username, password):
+    return client.post('/api/login', json={'username': username, 'password': password})
+
+
+def test_login_rejects_a_wrong_password_and_an_unknown_user(client):
+    assert login(client, 'user1', 'password1').status_code == 200
+    assert login(client, 'user1', 'wrong').status_code == 401
+    assert login(client, 'nobody', 'password1').status_code == 401
+
+
+def test_legacy_hash_is_upgraded_on_login(client, app):
+    user_id = add_user(app, 'legacy_user', hashlib.sha256(b'old-secret').hexdigest())
+    assert login(client, 'legacy_user', 'old-secret').status_code == 200
+    upgraded = stored_password(app, user_id)
+    assert not app_module.password_needs_rehash(upgraded)
+    assert login(client, 'legacy_user', 'old-secret').status_code == 200
+
+
+def test_busy_pool_skips_the_upgrade_but_logs_the_user_in(client, app, monkeypatch):
+    legacy = hashlib.sha256(b'busy-secret').hexdigest()
+    user_id = add_user(app, 'busy_user', legacy)
+
+    def busy(password):
+        raise app_module.PasswordHasherBusy()
+
+    monkeypatch.setattr(app_module.password_hasher, 'hash', busy)
+    response = login(client, 'busy_user', 'busy-secret')
+    assert response.status_code == 200
+    assert response.get_json()['user']['id'] == user_id
+    assert stored_password(app, user_id) == legacy
+
+
+def test_busy_pool_answers_503_when_it_cannot_verify(client, monkeypatch):
+    def busy(password, hashed):
+        raise app_module.PasswordHasherBusy()
+
+    monkeypatch.setattr(app_module.password_hasher, 'verify', busy)
+    response = login(client, 'user1', 'password1')
+    assert response.status_code == 503
+    assert response.headers['Retry-After'] == '1'
@@ -0,0 +1,93 @@
+import app as app_module
+from conftest import auth
+
+SHOPPER = 4
+
+
+def assert_summary_matches_cart(client):
+    cart = client.get('/api/cart', headers=auth(SHOPPER)).get_json()
+    summary = client.get('/api/cart/summary', headers=auth(SHOPPER)).get_json()
+    assert summary['item_count'] == cart['item_count']
+    assert summary['total'] == round(cart['total'], 2)
+    assert {r['restaurant_id']: r['subtotal'] for r in summary['restaurants']} == \
+        {r['restaurant']['id']: round(r['subtotal'], 2) for r in cart['restaurants']}
+    return summary
+
+
+def cart_item_id(client, menu_item_id):
+    cart = client.get('/api/cart', headers=auth(SHOPPER)).get_json()
+    return next(item['id'] for restaurant in cart['restaurants'] for item in restaurant['items']
+                if item['menu_item_id'] == menu_item_id)
+
+
+def test_summary_follows_single_item_changes(client):
+    client.delete('/api/cart/clear', headers=auth(SHOPPER))
+    client.post('/api/cart', headers=auth(SHOPPER), json={'menu_item_id': 5, 'quantity': 2})
+    client.post('/api/cart', headers=auth(SHOPPER), json={'menu_item_id': 5, 'quantity': 1})
+    client.post('/api/cart', headers=auth(SHOPPER), json={'menu_item_id': 10, 'quantity': 1})
+    assert assert_summary_matches_cart(client)['item_count'] == 2
+
+    item_id = cart_item_id(client, 5)
+    client.put(f'/api/cart/{item_id}', headers=auth(SHOPPER), json={'quantity': 4})
+    assert_summary_matches_cart(client)
+
+    client.delete(f'/api/cart/{item_id}', headers=auth(SHOPPER))
+    summary = assert_summary_matches_cart(client)
+    assert [r['restaurant_id'] for r in summary['restaurants']] == [3]
+
+    client.delete('/api/cart/clear', headers=auth(SHOPPER))
+    assert assert_summary_matches_cart(client)['item_count'] == 0
+
+
+def test_summary_follows_batched_operations(client):
+    client.delete('/api/cart/clear', headers=auth(SHOPPER))
+    client.post('/api/cart', headers=auth(SHOPPER), json={'menu_item_id': 6, 'quantity': 1})
+    item_id = cart_item_id(client, 6)
+    response = client.patch('/api/cart', headers=auth(SHOPPER), json={'operations': [
+        {'op': 'add', 'menu_item_id': 7, 'quantity': 3},
+        {'op': 'add', 'menu_item_id': 11},
+        {'op': 'set', 'item_id': item_id, 'quantity': 5},
+    ]})
+    assert response.status_code == 200
+    assert assert_summary_matches_cart(client)['item_count'] == 3
+
+    response = client.patch('/api/cart', headers=auth(SHOPPER), json={'operations': [
+        {'op': 'remove', 'item_id': item_id},
+        {'op': 'add', 'menu_item_id': 999},
+    ]})
+    assert response.status_code == 400
+    assert assert_summary_matches_cart(client)['item_count'] == 3
+
+
+def test_incremental_summary_equals_a_rebuild(client, app):
+    client.delete('/api/cart/clear', headers=auth(SHOPPER))
+    client.post('/api/cart', headers=auth(SHOPPER), json={'menu_item_id': 8, 'quantity': 2})
+    client.post('/api/cart', headers=auth(SHOPPER), json={'menu_item_id': 12, 'quantity': 1})
+    before = assert_summary_matches_cart(client)
+
+    with app.app_context():
+        app_module.rebuild_cart_summaries(app_module.db.session.connection(), [SHOPPER])
+        app_module.db.session.commit()
+    assert client.get('/api/cart/summary', headers=auth(SHOPPER)).get_json() == before
+
+
+def test_batch_rejects_malformed_input_with_400(client):
+    client.delete('/api/cart/clear', headers=auth(SHOPPER))
+    client.post('/api/cart', headers=auth(SHOPPER), json={'menu_item_id': 6, 'quantity': 1})
+    item_id = cart_item_id(client, 6)
+
+    for body in ([{'op': 'add', 'menu_item_id': 7}], [], 'operations', {'operations': {}}):
+        assert client.patch('/api/cart', headers=auth(SHOPPER), json=body).status_code == 400
+
+    for operation in ({'op': 'add', 'menu_item_id': [1]},
+                      {'op': 'add', 'menu_item_id': {'id': 1}},
+                      {'op': 'add', 'menu_item_id': True},
+                      {'op': 'add', 'menu_item_id': 7, 'quantity': True},
+                      {'op': 'set', 'item_id': {}, 'quantity': 2},
+                      {'op': 'set', 'item_id': [item_id], 'quantity': 2},
+                      {'op': 'set', 'item_id': item_id, 'quantity': False},
+                      {'op': 'remove', 'item_id': True}):
+        response = client.patch('/api/cart', headers=auth(SHOPPER), json={'operations': [operation]})
+        assert response.status_code == 400, operation
+        assert response.get_json()['errors'][0]['index'] == 0
+    assert assert_summary_matches_cart(client)['item_count'] == 1
@@ -0,0 +1,44 @@
+import pytest
+
+from conftest import auth
+
+
+@pytest.mark.parametrize('path, headers', [
+    ('/api/restaurants', {}),
+    ('/api/restaurants/1/menu', {}),
+    ('/api/orders/history', auth(1)),
+])
+@pytest.mark.parametrize('accept_encoding, weak', [('gzip', True), ('identity', False)])
+def test_not_modified_repeats_the_validator_of_the_full_response(client, path, headers,
+                                                                   accept_encoding, weak):
+    headers = dict(headers, **{'Accept-Encoding': accept_encoding})
+    full = client.get(path, headers=headers)
+    assert full.status_code == 200
+    etag = full.headers['ETag']
+    assert etag.startswith('W/') == weak
+
+    revalidated = client.get(path, headers=dict(headers, **{'If-None-Match': etag}))
+    assert revalidated.status_code == 304
+    assert revalidated.headers['ETag'] == etag
+
+
+def test_compressed_body_is_served_with_a_weak_tag(client, app, monkeypatch):
+    monkeypatch.setitem(app.config, 'COMPRESSION_MIN_SIZE', 0)
+    headers = {'Accept-Encoding': 'gzip'}
+    full = client.get('/api/restaurants/1/menu', headers=headers)
+    assert full.headers['Content-Encoding'] == 'gzip'
+    assert full.headers['ETag'].startswith('W/')
+
+    revalidated = client.get('/api/restaurants/1/menu',
+                             headers=dict(headers, **{'If-None-Match': full.headers['ETag']}))
+    assert revalidated.status_code == 304
+    assert revalidated.headers['ETag'] == full.headers['ETag']
+
+
+def test_writes_change_the_tag(client):
+    etag = client.get('/api/restaurants/3/menu').headers['ETag']
+    response = client.post('/api/restaurants/3/menu', headers=auth(3), json={'name': 'ชาเย็น', 'price': 25})
+    assert response.status_code == 201
+    response = client.get('/api/restaurants/3/menu', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
@@ -0,0 +1,52 @@
+import csv
+import gzip
+import io
+import json
+
+import app as app_module
+from conftest import auth
+
+CUSTOMER = 5
+OWNER = 1
+RESTAURANT = 1
+FUTURE = '2999-01-01T00:00:00Z'
+
+
+def export(client, headers=None, **params):
+    query = '&'.join(f'{key}={value}' for key, value in params.items())
+    return client.get(f'/api/restaurants/{RESTAURANT}/orders/export?{query}',
+                      headers=dict(auth(OWNER), **(headers or {})))
+
+
+def test_empty_csv_export_still_has_the_header(client):
+    response = export(client, since=FUTURE)
+    assert response.status_code == 200
+    body = response.get_data()
+    assert body.startswith('﻿'.encode())
+    assert next(csv.reader(io.StringIO(body.decode('utf-8-sig')))) == app_module.EXPORT_COLUMNS
+
+    compressed = export(client, headers={'Accept-Encoding': 'gzip'}, since=FUTURE)
+    assert compressed.headers['Content-Encoding'] == 'gzip'
+    body = gzip.decompress(compressed.get_data())
+    assert body.decode('utf-8-sig').splitlines() == [','.join(app_module.EXPORT_COLUMNS)]
+
+
+def test_export_has_one_line_per_item_or_order(client):
+    client.delete('/api/cart/clear', headers=auth(CUSTOMER))
+    client.post('/api/cart', headers=auth(CUSTOMER), json={'menu_item_id': 1, 'quantity': 2})
+    client.post('/api/cart', headers=auth(CUSTOMER), json={'menu_item_id': 2, 'quantity': 1})
+    order_id = client.post('/api/orders', headers=auth(CUSTOMER), json={}).get_json()['order_ids'][0]
+
+    rows = list(csv.DictReader(io.StringIO(export(client).get_data().decode('utf-8-sig'))))
+    lines = [row for row in rows if row['order_id'] == str(order_id)]
+    assert sorted(row['menu_item_id'] for row in lines) == ['1', '2']
+
+    orders = [json.loads(line) for line in export(client, format='ndjson').get_data(as_text=True).splitlines()]
+    order = next(order for order in orders if order['id'] == order_id)
+    assert len(order['items']) == 2
+
+
+def test_export_is_for_the_owner_only(client):
+    response = client.get(f'/api/restaurants/{RESTAURANT}/orders/export', headers=auth(CUSTOMER))
+    assert response.status_code == 403
+    assert export(client, format='xml').status_code == 400
@@ -0,0 +1,37 @@
+import app as app_module
+from conftest import auth
+
+
+def test_probing_a_restaurant_before_it_exists_does_not_lock_its_owner_out(client, app):
+    with app.app_context():
+        next_id = app_module.db.session.scalar(app_module.db.select(app_module.db.func.max(
+            app_module.Restaurant.id))) + 1
+    assert client.get(f'/api/restaurants/{next_id}/analytics', headers=auth(4)).status_code == 404
+
+    response = client.post('/api/restaurants', headers=auth(4), json={
+        'name': 'ร้านใหม่', 'open_time': '08:00', 'close_time': '20:00', 'location': 'หน้าโรงเรียน',
+        'pickup_time': '12:30', 'pickup_location': 'หน้าโรงเรียน'
+    })
+    assert response.get_json()['id'] == next_id
+    assert client.get(f'/api/restaurants/{next_id}/analytics', headers=auth(4)).status_code == 200
+    assert client.get(f'/api/restaurants/{next_id}/analytics', headers=auth(5)).status_code == 403
+
+
+def test_unknown_user_is_not_remembered(client, app):
+    with app.app_context():
+        next_id = app_module.db.session.scalar(app_module.db.select(app_module.db.func.max(app_module.User.id))) + 1
+    assert client.get('/api/check-auth', headers=auth(next_id)).get_json().get('authenticated') is not True
+
+    with app.app_context():
+        app_module.db.session.add(app_module.User(id=next_id, username=f'late_user_{next_id}',
+                                                  password=app_module.hash_password('secret'),
+                                                  display_name='มาทีหลัง'))
+        app_module.db.session.commit()
+    assert client.get('/api/check-auth', headers=auth(next_id)).get_json()['authenticated'] is True
+
+
+def test_known_user_is_resolved_without_queries(client, statements):
+    client.get('/api/check-auth', headers=auth(1))
+    statements.clear()
+    assert client.get('/api/check-auth', headers=auth(1)).get_json()['authenticated'] is True
+    assert statements == []
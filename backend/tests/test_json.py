@@ -0,0 +1,30 @@
+import pytest
+from flask import jsonify
+
+import app as app_module
+
+
+@pytest.mark.parametrize('args, kwargs, expected', [
+    (({'ชื่อ': 'ข้าวผัด'},), {}, {'ชื่อ': 'ข้าวผัด'}),
+    ((1, 2), {}, [1, 2]),
+    ((), {'a': 1}, {'a': 1}),
+    ((), {}, None),
+])
+def test_jsonify_arguments(app, args, kwargs, expected):
+    with app.test_request_context():
+        response = jsonify(*args, **kwargs)
+    assert response.mimetype == 'application/json'
+    assert response.get_json() == expected
+
+
+def test_bodies_are_compact_utf8(app):
+    with app.test_request_context():
+        body = jsonify({'name': 'ข้าว', 'price': 45}).get_data()
+    assert body == '{"name":"ข้าว","price":45}'.encode()
+
+
+def test_both_providers_encode_the_same(app):
+    value = {'name': 'ส้มตำ', 'items': [1, 2.5, None, True], 'nested': {'a': []}}
+    fast = app_module.FastJSONProvider(app)
+    stdlib = app_module.FastJSONProvider(app, use_orjson=False)
+    assert fast.loads(fast.dumps_bytes(value)) == stdlib.loads(stdlib.dumps_bytes(value))
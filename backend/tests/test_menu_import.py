@@ -0,0 +1,135 @@
+import io
+
+import pytest
+
+from conftest import auth
+
+OWNER = 4
+SHOPPER = 5
+
+
+@pytest.fixture
+def restaurant(client):
+    response = client.post('/api/restaurants', headers=auth(OWNER), json={
+        'name': 'ร้านนำเข้าเมนู', 'open_time': '08:00', 'close_time': '20:00', 'location': 'ตลาดมหาวิทยาลัย',
+        'pickup_time': '12:30', 'pickup_location': 'ตลาดมหาวิทยาลัย'
+    })
+    restaurant_id = response.get_json()['id']
+    response = client.post(f'/api/restaurants/{restaurant_id}/menu/bulk', headers=auth(OWNER), json=[
+        {'name': 'ข้าวไข่เจียว', 'price': 35},
+        {'name': 'ข้าวผัดหมู', 'price': 45},
+        {'name': 'ต้มจืด', 'price': 50},
+    ])
+    assert response.status_code == 200
+    return restaurant_id, response.get_json()['created']
+
+
+def menu(client, restaurant_id):
+    return {item['id']: item for item in client.get(f'/api/restaurants/{restaurant_id}/menu').get_json()['menu']}
+
+
+def test_invalid_rows_are_reported_and_nothing_is_written(client, restaurant):
+    restaurant_id, (first, second, _) = restaurant
+    before = menu(client, restaurant_id)
+    response = client.post(f'/api/restaurants/{restaurant_id}/menu/bulk', headers=auth(OWNER), json=[
+        {'name': 'ถูกต้อง', 'price': 10},
+        {'name': 'ไม่มีราคา'},
+        {'id': 1, 'price': 10},
+        {'action': 'rename', 'id': first},
+        {'id': second, 'price': -5},
+        {'id': second, 'name': 'x' * 101},
+        {'action': 'delete', 'id': first},
+        {'action': 'delete', 'id': first},
+    ])
+    assert response.status_code == 400
+    errors = {entry['row']: entry['errors'] for entry in response.get_json()['errors']}
+    assert set(errors) == {1, 2, 3, 4, 5, 7}
+    assert 'price' in errors[1] and 'id' in errors[2] and 'action' in errors[3]
+    assert 'price' in errors[4] and {'id', 'name'} <= set(errors[5]) and 'id' in errors[7]
+    assert menu(client, restaurant_id) == before
+
+
+def test_rows_are_applied_together_and_the_menu_cache_refreshes(client, restaurant):
+    restaurant_id, (first, second, third) = restaurant
+    menu(client, restaurant_id)
+    response = client.post(f'/api/restaurants/{restaurant_id}/menu/bulk', headers=auth(OWNER), json={'items': [
+        {'name': 'น้ำเปล่า', 'price': 10},
+        {'id': first, 'price': 40, 'description': 'ไข่สองฟอง'},
+        {'action': 'unavailable', 'id': second},
+        {'action': 'delete', 'id': third},
+    ]})
+    assert response.status_code == 200
+    data = response.get_json()
+    assert len(data['created']) == 1 and data['deleted'] == [third] and data['kept_unavailable'] == []
+
+    items = menu(client, restaurant_id)
+    assert set(items) == {first, data['created'][0]}
+    assert items[first]['price'] == 40 and items[first]['description'] == 'ไข่สองฟอง'
+
+
+def test_csv_upload(client, restaurant):
+    restaurant_id, (first, _, _) = restaurant
+    text = ('﻿action,id,name,price,description,image_url,is_available\n'
+            'create,,ชาไทย,25,,,yes\n'
+            f'update,{first},,30,,,\n')
+    response = client.post(f'/api/restaurants/{restaurant_id}/menu/bulk', headers=auth(OWNER),
+                           data={'file': (io.BytesIO(text.encode()), 'menu.csv')},
+                           content_type='multipart/form-data')
+    assert response.status_code == 200
+    items = menu(client, restaurant_id)
+    assert items[first]['price'] == 30
+    assert items[response.get_json()['created'][0]]['name'] == 'ชาไทย'
+
+    response = client.post(f'/api/restaurants/{restaurant_id}/menu/bulk', data='id,price\nabc,1\n',
+                           headers=dict(auth(OWNER), **{'Content-Type': 'text/csv'}))
+    assert response.status_code == 400
+    assert response.get_json()['errors'][0]['row'] == 0
+
+
+def test_ordered_items_are_kept_and_carts_are_repriced(client, restaurant):
+    restaurant_id, (first, second, _) = restaurant
+    client.delete('/api/cart/clear', headers=auth(SHOPPER))
+    client.post('/api/cart', headers=auth(SHOPPER), json={'menu_item_id': first, 'quantity': 1})
+    assert client.post('/api/orders', headers=auth(SHOPPER), json={}).status_code == 201
+    client.post('/api/cart', headers=auth(SHOPPER), json={'menu_item_id': second, 'quantity': 2})
+
+    response = client.post(f'/api/restaurants/{restaurant_id}/menu/bulk', headers=auth(OWNER), json=[
+        {'action': 'delete', 'id': first},
+        {'id': second, 'price': 60},
+    ])
+    assert response.get_json()['kept_unavailable'] == [first]
+    assert client.get('/api/cart/summary', headers=auth(SHOPPER)).get_json()['total'] == 120
+    history = client.get('/api/orders/history', headers=auth(SHOPPER)).get_json()['orders']
+    assert history[0]['items'][0]['name'] == 'ข้าวไข่เจียว'
+
+
+def test_only_the_owner_can_import(client, restaurant):
+    restaurant_id, _ = restaurant
+    url = f'/api/restaurants/{restaurant_id}/menu/bulk'
+    assert client.post(url, headers=auth(SHOPPER), json=[{'name': 'x', 'price': 1}]).status_code == 403
+    assert client.post('/api/restaurants/9999/menu/bulk', headers=auth(OWNER), json=[]).status_code == 404
+    assert client.post(url, headers=auth(OWNER), json=[]).status_code == 400
+
+
+def test_renaming_an_ordered_item_invalidates_order_views(client, restaurant):
+    restaurant_id, (first, second, _) = restaurant
+    client.delete('/api/cart/clear', headers=auth(SHOPPER))
+    client.post('/api/cart', headers=auth(SHOPPER), json={'menu_item_id': first, 'quantity': 1})
+    assert client.post('/api/orders', headers=auth(SHOPPER), json={}).status_code == 201
+    queue_url = f'/api/restaurants/{restaurant_id}/orders'
+    queue_etag = client.get(queue_url, headers=auth(OWNER)).headers['ETag']
+    history_etag = client.get('/api/orders/history', headers=auth(SHOPPER)).headers['ETag']
+
+    # Not ordered: order views stay valid
+    client.post(f'/api/restaurants/{restaurant_id}/menu/bulk', headers=auth(OWNER),
+                json=[{'id': second, 'name': 'ข้าวผัดกุ้ง'}])
+    assert client.get(queue_url, headers=dict(auth(OWNER), **{'If-None-Match': queue_etag})).status_code == 304
+
+    client.post(f'/api/restaurants/{restaurant_id}/menu/bulk', headers=auth(OWNER),
+                json=[{'id': first, 'name': 'ข้าวไข่เจียวหมูสับ'}])
+    response = client.get(queue_url, headers=dict(auth(OWNER), **{'If-None-Match': queue_etag}))
+    assert response.status_code == 200
+    assert response.get_json()['orders'][0]['items'][0]['name'] == 'ข้าวไข่เจียวหมูสับ'
+    response = client.get('/api/orders/history', headers=dict(auth(SHOPPER), **{'If-None-Match': history_etag}))
+    assert response.status_code == 200
+    assert response.get_json()['orders'][0]['items'][0]['name'] == 'ข้าวไข่เจียวหมูสับ'
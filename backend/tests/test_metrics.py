@@ -0,0 +1,15 @@
+import pytest
+from sqlalchemy.exc import OperationalError
+
+import app as app_module
+
+
+def test_failed_statements_do_not_leave_timers_on_the_connection(app):
+    with app.app_context():
+        with app_module.db.engine.connect() as conn:
+            for _ in range(3):
+                with pytest.raises(OperationalError):
+                    conn.exec_driver_sql('SELECT * FROM no_such_table')
+            conn.exec_driver_sql('SELECT 1')
+            assert conn.info.get('statement_start') == []
+
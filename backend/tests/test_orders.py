@@ -0,0 +1,65 @@
+from conftest import auth
+
+CUSTOMER = 5
+
+
+def fill_cart(client, *items):
+    assert client.delete('/api/cart/clear', headers=auth(CUSTOMER)).status_code == 200
+    for menu_item_id, quantity in items:
+        response = client.post('/api/cart', headers=auth(CUSTOMER),
+                               json={'menu_item_id': menu_item_id, 'quantity': quantity})
+        assert response.status_code == 200
+
+
+def test_checkout_rejects_non_numeric_expected_total(client):
+    fill_cart(client, (5, 1))
+    for value in ('abc', [1], {'total': 1}, True):
+        response = client.post('/api/orders', headers=auth(CUSTOMER), json={'expected_total': value})
+        assert response.status_code == 400
+    for body in ([], [{'expected_total': 1}], 'total'):
+        response = client.post('/api/orders', headers=auth(CUSTOMER), json=body)
+        assert response.status_code == 400
+    # Nothing was left holding the write lock
+    assert client.post('/api/cart', headers=auth(CUSTOMER),
+                       json={'menu_item_id': 6, 'quantity': 1}).status_code == 200
+
+
+def test_checkout_refuses_a_changed_total(client):
+    fill_cart(client, (5, 2))
+    total = client.get('/api/cart/summary', headers=auth(CUSTOMER)).get_json()['total']
+    response = client.post('/api/orders', headers=auth(CUSTOMER), json={'expected_total': total + 1})
+    assert response.status_code == 409
+    assert response.get_json()['total'] == total
+
+
+def test_checkout_creates_one_order_per_restaurant_and_empties_the_cart(client):
+    fill_cart(client, (5, 2), (9, 1))
+    summary = client.get('/api/cart/summary', headers=auth(CUSTOMER)).get_json()
+    response = client.post('/api/orders', headers=auth(CUSTOMER), json={'expected_total': summary['total']})
+    assert response.status_code == 201
+
+    orders = [client.get(f'/api/orders/{order_id}', headers=auth(CUSTOMER)).get_json()
+              for order_id in response.get_json()['order_ids']]
+    assert len(orders) == 2 and len({order['restaurant_name'] for order in orders}) == 2
+    assert round(sum(order['total_price'] for order in orders), 2) == summary['total']
+    assert client.get('/api/cart/summary', headers=auth(CUSTOMER)).get_json()['item_count'] == 0
+
+
+def checkout_statements(client, statements, *items):
+    fill_cart(client, *items)
+    statements.clear()
+    response = client.post('/api/orders', headers=auth(CUSTOMER), json={})
+    assert response.status_code == 201
+    return response.get_json()['order_ids'], len(statements)
+
+
+def test_checkout_statement_count_does_not_grow_with_restaurants(client, statements):
+    _, single = checkout_statements(client, statements, (5, 1))
+    order_ids, several = checkout_statements(client, statements, (9, 1), (1, 2), (10, 1), (6, 1))
+    assert several == single
+
+    # Each order id came back with the items of its own restaurant
+    orders = [client.get(f'/api/orders/{order_id}', headers=auth(CUSTOMER)).get_json() for order_id in order_ids]
+    names = [client.get(f'/api/restaurants/{restaurant_id}').get_json()['name'] for restaurant_id in (3, 1, 2)]
+    assert [order['restaurant_name'] for order in orders] == names
+    assert [[item['quantity'] for item in order['items']] for order in orders] == [[1, 1], [2], [1]]
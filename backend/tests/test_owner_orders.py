@@ -0,0 +1,111 @@
+import json
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlencode
+
+import app as app_module
+from conftest import auth
+
+CUSTOMER = 4
+OWNER = 2
+RESTAURANT = 2
+BANGKOK = timezone(timedelta(hours=7))
+
+
+def place_order(client, menu_item_id=6):
+    client.delete('/api/cart/clear', headers=auth(CUSTOMER))
+    client.post('/api/cart', headers=auth(CUSTOMER), json={'menu_item_id': menu_item_id, 'quantity': 1})
+    response = client.post('/api/orders', headers=auth(CUSTOMER), json={})
+    assert response.status_code == 201
+    return response.get_json()['order_ids'][0]
+
+
+def queue_ids(client, **params):
+    response = client.get(f'/api/restaurants/{RESTAURANT}/orders?{urlencode(params)}', headers=auth(OWNER))
+    assert response.status_code == 200
+    return {order['id'] for order in response.get_json()['orders']}
+
+
+def test_time_window_accepts_utc_offsets(client):
+    order_id = place_order(client)
+    now = datetime.now(timezone.utc)
+    hour_ago, hour_ahead = now - timedelta(hours=1), now + timedelta(hours=1)
+
+    assert order_id in queue_ids(client, since=hour_ago.astimezone(BANGKOK).isoformat())
+    assert order_id in queue_ids(client, since=hour_ago.strftime('%Y-%m-%dT%H:%M:%SZ'))
+    assert order_id in queue_ids(client, since=hour_ago.replace(tzinfo=None).isoformat())
+    assert order_id not in queue_ids(client, since=hour_ahead.astimezone(BANGKOK).isoformat())
+    assert order_id not in queue_ids(client, until=hour_ago.astimezone(BANGKOK).isoformat())
+
+
+def test_export_uses_the_same_time_window(client):
+    order_id = place_order(client)
+    since = (datetime.now(timezone.utc) - timedelta(hours=1)).astimezone(BANGKOK).isoformat()
+    response = client.get(f'/api/restaurants/{RESTAURANT}/orders/export?'
+                          f'{urlencode({"format": "ndjson", "since": since})}', headers=auth(OWNER))
+    assert response.status_code == 200
+    rows = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert order_id in {row['id'] for row in rows}
+
+
+def test_queue_filters_by_status_and_rejects_bad_arguments(client):
+    order_id = place_order(client)
+    assert order_id in queue_ids(client, status='pending')
+    assert order_id not in queue_ids(client, status='completed')
+    for params in ({'status': 'lost'}, {'since': 'yesterday'}):
+        response = client.get(f'/api/restaurants/{RESTAURANT}/orders?{urlencode(params)}', headers=auth(OWNER))
+        assert response.status_code == 400
+
+
+def order_event_count(app):
+    with app.app_context():
+        return app_module.db.session.query(app_module.OrderEvent).count()
+
+
+def test_bulk_status_rejects_malformed_bodies(client):
+    order_id = place_order(client)
+    for body in ([order_id], {'order_ids': [True], 'status': 'confirmed'},
+                 {'order_ids': [order_id, False], 'status': 'confirmed'}):
+        assert client.put('/api/orders/status', headers=auth(OWNER), json=body).status_code == 400
+    assert client.put(f'/api/orders/{order_id}/status', headers=auth(OWNER),
+                      json=['confirmed']).status_code == 400
+
+
+def test_unchanged_status_leaves_events_and_etags_alone(client, app):
+    order_id = place_order(client)
+    queue_url = f'/api/restaurants/{RESTAURANT}/orders'
+    queue_etag = client.get(queue_url, headers=auth(OWNER)).headers['ETag']
+    history_etag = client.get('/api/orders/history', headers=auth(CUSTOMER)).headers['ETag']
+    events = order_event_count(app)
+
+    response = client.put(f'/api/orders/{order_id}/status', headers=auth(OWNER), json={'status': 'pending'})
+    assert response.status_code == 200
+    response = client.put('/api/orders/status', headers=auth(OWNER),
+                          json={'order_ids': [order_id], 'status': 'pending'})
+    assert response.get_json()['updated'] == 0
+
+    assert order_event_count(app) == events
+    assert client.get(queue_url, headers=dict(auth(OWNER), **{'If-None-Match': queue_etag})).status_code == 304
+    assert client.get('/api/orders/history',
+                      headers=dict(auth(CUSTOMER), **{'If-None-Match': history_etag})).status_code == 304
+
+    other_id = place_order(client)
+    response = client.put('/api/orders/status', headers=auth(OWNER),
+                          json={'order_ids': [order_id, other_id], 'status': 'confirmed'})
+    assert response.get_json()['updated'] == 2
+    assert order_event_count(app) == events + 2
+
+
+def test_customer_rename_invalidates_the_owner_queue(client):
+    order_id = place_order(client)
+    queue_url = f'/api/restaurants/{RESTAURANT}/orders'
+    etag = client.get(queue_url, headers=auth(OWNER)).headers['ETag']
+    old_name = client.get('/api/user/profile', headers=auth(CUSTOMER)).get_json()['display_name']
+
+    client.put('/api/user/profile', headers=auth(CUSTOMER), json={'display_name': 'ลูกค้าใหม่'})
+    try:
+        response = client.get(queue_url, headers=dict(auth(OWNER), **{'If-None-Match': etag}))
+        assert response.status_code == 200
+        names = {order['id']: order['customer_name'] for order in response.get_json()['orders']}
+        assert names[order_id] == 'ลูกค้าใหม่'
+    finally:
+        client.put('/api/user/profile', headers=auth(CUSTOMER), json={'display_name': old_name})
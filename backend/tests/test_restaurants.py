@@ -0,0 +1,47 @@
+import app as app_module
+from conftest import auth
+
+
+def add_restaurants(client, count, owner=4):
+    for n in range(count):
+        response = client.post('/api/restaurants', headers=auth(owner), json={
+            'name': f'ร้านทดสอบ {n}', 'open_time': '08:00', 'close_time': '20:00',
+            'location': 'โรงอาหารกลาง', 'pickup_time': '12:30', 'pickup_location': 'หน้าตึก IT'
+        })
+        assert response.status_code == 201
+        restaurant_id = response.get_json()['id']
+        response = client.post(f'/api/restaurants/{restaurant_id}/menu', headers=auth(owner),
+                               json={'name': 'ข้าวผัด', 'price': 40})
+        assert response.status_code == 201
+
+
+def list_statements(client, statements):
+    app_module.catalog_cache.clear()
+    statements.clear()
+    response = client.get('/api/restaurants')
+    assert response.status_code == 200
+    return response.get_json(), len(statements)
+
+
+def test_listing_statement_count_does_not_grow_with_restaurants(client, statements):
+    before, first = list_statements(client, statements)
+    add_restaurants(client, 5)
+    after, second = list_statements(client, statements)
+
+    assert len(after) == len(before) + 5
+    # Version lookup for the ETag plus one joined listing query
+    assert first <= 2
+    assert second == first
+
+
+def test_listing_includes_owner_and_available_menu_count(client):
+    restaurants = {r['id']: r for r in client.get('/api/restaurants').get_json()}
+    assert restaurants[1]['owner_name'] == 'สมชาย'
+    assert restaurants[1]['menu_count'] == 4
+
+
+def test_cached_listing_runs_at_most_the_version_lookup(client, statements):
+    client.get('/api/restaurants')
+    statements.clear()
+    assert client.get('/api/restaurants').status_code == 200
+    assert len(statements) <= 1
@@ -0,0 +1,87 @@
+import threading
+
+import app as app_module
+from conftest import auth
+
+CUSTOMER = 4
+OWNER = 3
+RESTAURANT = 3
+
+
+def place_orders(client, count):
+    order_ids = []
+    for n in range(count):
+        client.delete('/api/cart/clear', headers=auth(CUSTOMER))
+        client.post('/api/cart', headers=auth(CUSTOMER), json={'menu_item_id': 9 + n % 3, 'quantity': 1 + n % 2})
+        response = client.post('/api/orders', headers=auth(CUSTOMER), json={})
+        assert response.status_code == 201
+        order_ids.extend(response.get_json()['order_ids'])
+    return order_ids
+
+
+def rollups(connection):
+    restaurant_rows = {
+        (row.restaurant_id, row.day, row.status): (row.order_count, round(row.revenue, 2))
+        for row in connection.execute(app_module.db.select(app_module.RestaurantDailySales.__table__))
+        if row.order_count}
+    item_rows = {
+        (row.restaurant_id, row.day, row.menu_item_id): (row.quantity, round(row.revenue, 2))
+        for row in connection.execute(app_module.db.select(app_module.MenuItemDailySales.__table__))
+        if row.quantity}
+    return restaurant_rows, item_rows
+
+
+def assert_rollups_match_history(app):
+    with app.app_context():
+        with app_module.db.engine.connect() as connection:
+            # Rebuilt inside a transaction that is rolled back afterwards
+            incremental = rollups(connection)
+            app_module.rebuild_sales_rollups(connection)
+            rebuilt = rollups(connection)
+            connection.rollback()
+    assert incremental == rebuilt
+
+
+def set_status(client, order_id, status):
+    return client.put(f'/api/orders/{order_id}/status', headers=auth(OWNER), json={'status': status})
+
+
+def test_rollups_follow_checkout_and_status_changes(client, app):
+    order_ids = place_orders(client, 4)
+    assert set_status(client, order_ids[0], 'confirmed').status_code == 200
+    assert set_status(client, order_ids[1], 'cancelled').status_code == 200
+    assert set_status(client, order_ids[1], 'pending').status_code == 200
+    response = client.put('/api/orders/status', headers=auth(OWNER),
+                          json={'order_ids': order_ids[2:], 'status': 'cancelled'})
+    assert response.status_code == 200
+    assert_rollups_match_history(app)
+
+
+def test_concurrent_status_changes_do_not_double_count(app):
+    client = app.test_client()
+    order_ids = place_orders(client, 6)
+    barrier = threading.Barrier(2)
+    statuses = []
+
+    def change(order_id, status):
+        worker = app.test_client()
+        barrier.wait()
+        statuses.append(set_status(worker, order_id, status).status_code)
+
+    for order_id in order_ids:
+        threads = [threading.Thread(target=change, args=(order_id, status))
+                   for status in ('cancelled', 'confirmed')]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        barrier.reset()
+
+    assert statuses == [200] * len(statuses) and len(statuses) == 2 * len(order_ids)
+    assert_rollups_match_history(app)
+
+
+def test_analytics_reports_the_rollups(client):
+    response = client.get(f'/api/restaurants/{RESTAURANT}/analytics', headers=auth(OWNER))
+    assert response.status_code == 200
+    assert client.get(f'/api/restaurants/{RESTAURANT}/analytics', headers=auth(CUSTOMER)).status_code == 403
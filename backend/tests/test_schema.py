@@ -0,0 +1,22 @@
+import app as app_module
+
+
+def index_columns(app, table):
+    with app.app_context():
+        return {index['name']: index['column_names'] for index in app_module.db.inspect(app_module.db.engine)
+                .get_indexes(table)}
+
+
+def test_no_index_is_a_prefix_of_another(app):
+    for table in ('restaurant', 'menu_item', 'cart_item', 'order', 'order_item', 'message'):
+        indexes = index_columns(app, table)
+        for name, columns in indexes.items():
+            for other, other_columns in indexes.items():
+                if other != name:
+                    assert other_columns[:len(columns)] != columns, f'{name} is a prefix of {other}'
+
+
+def test_migrations_are_recorded_once(app):
+    with app.app_context():
+        names = [name for name, in app_module.db.session.query(app_module.SchemaMigration.name)]
+    assert sorted(names) == sorted(name for name, _ in app_module.MIGRATIONS)
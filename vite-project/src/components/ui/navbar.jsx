@@ -1,15 +1,29 @@
-import React from 'react';
+import React, { useState, useEffect } from 'react';
 import { useNavigate } from 'react-router-dom';
 import { Home, FileText, ShoppingCart, User } from 'lucide-react';
+import { cartAPI, messageAPI } from '../../services/api';
 import '../../styles/Navbar.css';
 
 const Navbar = ({ activeTab = 'home' }) => {
   const navigate = useNavigate();
+  const [unreadCount, setUnreadCount] = useState(0);
+  const [cartCount, setCartCount] = useState(0);
+
+  // Unread chat and cart badges; each is a single small read, no rows are loaded
+  useEffect(() => {
+    if (!localStorage.getItem('user')) return;
+    messageAPI.unreadCount()
+      .then((data) => setUnreadCount(data.unread))
+      .catch(() => {});
+    cartAPI.summary()
+      .then((data) => setCartCount(data.item_count))
+      .catch(() => {});
+  }, []);
 
   const navItems = [
     { id: 'home', icon: Home, label: 'หน้าหลัก', path: '/home' },
-    { id: 'history', icon: FileText, label: 'ประวัติ', path: '/history' },
-    { id: 'cart', icon: ShoppingCart, label: 'ตะกร้า', path: '/cart' },
+    { id: 'history', icon: FileText, label: 'ประวัติ', path: '/history', badge: unreadCount },
+    { id: 'cart', icon: ShoppingCart, label: 'ตะกร้า', path: '/cart', badge: cartCount },
     { id: 'profile', icon: User, label: 'โปรไฟล์', path: '/profile' }
   ];
 
@@ -30,6 +44,7 @@ const Navbar = ({ activeTab = 'home' }) => {
               className={`nav-item ${activeTab === item.id ? 'active' : ''}`}
             >
               <Icon size={24} />
+              {item.badge > 0 && <span className="nav-badge">{item.badge}</span>}
               <span className="nav-label">{item.label}</span>
             </button>
           );
@@ -53,6 +68,7 @@ const Navbar = ({ activeTab = 'home' }) => {
               >
                 <Icon size={20} />
                 <span>{item.label}</span>
+                {item.badge > 0 && <span className="nav-badge">{item.badge}</span>}
               </button>
             );
           })}
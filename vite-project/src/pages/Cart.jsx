@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import { useNavigate } from 'react-router-dom';
 import { ArrowLeft, Trash2, Plus, Minus, MapPin, Clock, ShoppingBag } from 'lucide-react';
 import { cartAPI, orderAPI } from '../services/api';
@@ -10,6 +10,9 @@ function Cart() {
   const [cartData, setCartData] = useState({ restaurants: [], total: 0, item_count: 0 });
   const [loading, setLoading] = useState(true);
   const [ordering, setOrdering] = useState(false);
+  // Quantity taps waiting to be sent, keyed by cart item id
+  const pendingQuantities = useRef({});
+  const flushTimer = useRef(null);
 
   useEffect(() => {
     const userData = localStorage.getItem('user');
@@ -18,6 +21,11 @@ function Cart() {
       return;
     }
     fetchCart();
+
+    return () => {
+      clearTimeout(flushTimer.current);
+      flushPending();
+    };
   }, [navigate]);
 
   const fetchCart = async () => {
@@ -31,26 +39,51 @@ function Cart() {
     }
   };
 
-  const handleUpdateQuantity = async (itemId, newQuantity) => {
+  // Local copy of the cart with one item's quantity changed (0 removes it)
+  const applyQuantity = (cart, itemId, quantity) => {
+    const restaurants = cart.restaurants
+      .map((group) => {
+        const items = group.items
+          .filter((item) => item.id !== itemId || quantity > 0)
+          .map((item) => (item.id === itemId ? { ...item, quantity, total: item.price * quantity } : item));
+        return { ...group, items, subtotal: items.reduce((sum, item) => sum + item.total, 0) };
+      })
+      .filter((group) => group.items.length > 0);
+    return {
+      ...cart,
+      restaurants,
+      total: restaurants.reduce((sum, group) => sum + group.subtotal, 0),
+      item_count: restaurants.reduce((sum, group) => sum + group.items.length, 0),
+    };
+  };
+
+  // Send all pending quantity changes as one batched request
+  const flushPending = async () => {
+    const operations = Object.entries(pendingQuantities.current).map(([itemId, quantity]) => (
+      { op: 'set', item_id: Number(itemId), quantity }
+    ));
+    pendingQuantities.current = {};
+    if (operations.length === 0) return;
+
     try {
-      if (newQuantity <= 0) {
-        await cartAPI.remove(itemId);
-      } else {
-        await cartAPI.update(itemId, { quantity: newQuantity });
-      }
-      fetchCart();
+      const data = await cartAPI.batch(operations);
+      setCartData(data);
     } catch (error) {
       console.error('Error updating cart:', error);
+      fetchCart();
     }
   };
 
-  const handleRemoveItem = async (itemId) => {
-    try {
-      await cartAPI.remove(itemId);
-      fetchCart();
-    } catch (error) {
-      console.error('Error removing item:', error);
-    }
+  // Update the screen right away; a burst of taps becomes one request
+  const handleUpdateQuantity = (itemId, newQuantity) => {
+    setCartData((prev) => applyQuantity(prev, itemId, Math.max(0, newQuantity)));
+    pendingQuantities.current[itemId] = Math.max(0, newQuantity);
+    clearTimeout(flushTimer.current);
+    flushTimer.current = setTimeout(flushPending, 400);
+  };
+
+  const handleRemoveItem = (itemId) => {
+    handleUpdateQuantity(itemId, 0);
   };
 
   const handleClearCart = async () => {
@@ -72,12 +105,17 @@ function Cart() {
 
     setOrdering(true);
     try {
-      await orderAPI.create();
+      // Make sure the server has the quantities the user is looking at
+      clearTimeout(flushTimer.current);
+      await flushPending();
+      await orderAPI.create(cartData.total);
       alert('สั่งหิ้วสำเร็จ! ดูรายละเอียดได้ที่ประวัติการสั่งซื้อ');
       navigate('/history');
     } catch (error) {
       console.error('Error placing order:', error);
       alert('สั่งหิ้วไม่สำเร็จ: ' + error.message);
+      // Prices or availability may have changed; show the current cart
+      fetchCart();
     } finally {
       setOrdering(false);
     }
@@ -9,11 +9,14 @@ function Chat() {
   const { orderId } = useParams();
   const navigate = useNavigate();
   const [messages, setMessages] = useState([]);
+  const [olderCursor, setOlderCursor] = useState(null);
   const [newMessage, setNewMessage] = useState('');
   const [order, setOrder] = useState(null);
   const [loading, setLoading] = useState(true);
   const [sending, setSending] = useState(false);
   const messagesEndRef = useRef(null);
+  const lastIdRef = useRef(0);
+  const streamingRef = useRef(false);
 
   useEffect(() => {
     const userData = localStorage.getItem('user');
@@ -21,16 +24,70 @@ function Chat() {
       navigate('/');
       return;
     }
-    fetchData();
-    
-    // Poll for new messages every 5 seconds
-    const interval = setInterval(fetchMessages, 5000);
-    return () => clearInterval(interval);
+
+    const controller = new AbortController();
+    let interval = null;
+
+    // Fallback when the push stream is unavailable: poll every 5 seconds
+    const startPolling = () => {
+      streamingRef.current = false;
+      if (!interval) interval = setInterval(fetchMessages, 5000);
+    };
+
+    // Push channel; reconnects and resumes from the last seen id whenever
+    // the server ends the stream
+    const listen = async () => {
+      while (!controller.signal.aborted) {
+        try {
+          streamingRef.current = true;
+          await messageAPI.stream(
+            orderId,
+            lastIdRef.current,
+            (message) => {
+              setMessages((prev) => mergeMessages(prev, [message]));
+              // We are looking at the thread, so pushed replies count as read
+              if (!message.is_mine) {
+                messageAPI.markRead(orderId).catch(() => {});
+              }
+            },
+            controller.signal
+          );
+        } catch (error) {
+          if (controller.signal.aborted) return;
+          console.error('Message stream unavailable, polling instead:', error);
+          startPolling();
+          return;
+        }
+      }
+    };
+
+    fetchData().then(() => {
+      if (!controller.signal.aborted) listen();
+    });
+
+    return () => {
+      controller.abort();
+      streamingRef.current = false;
+      if (interval) clearInterval(interval);
+    };
   }, [orderId, navigate]);
 
+  // Only follow new messages, not older pages loaded at the top
+  const lastMessageId = messages.length ? messages[messages.length - 1].id : null;
   useEffect(() => {
     scrollToBottom();
-  }, [messages]);
+  }, [lastMessageId]);
+
+  // Merge a page into the thread by id, keeping chronological order
+  const mergeMessages = (current, incoming) => {
+    const byId = new Map(current.map((m) => [m.id, m]));
+    incoming.forEach((m) => byId.set(m.id, m));
+    const merged = [...byId.values()].sort((a, b) => a.id - b.id);
+    if (merged.length) {
+      lastIdRef.current = Math.max(lastIdRef.current, merged[merged.length - 1].id);
+    }
+    return merged;
+  };
 
   const fetchData = async () => {
     try {
@@ -39,7 +96,12 @@ function Chat() {
         messageAPI.get(orderId)
       ]);
       setOrder(orderData);
-      setMessages(messagesData);
+      // Resume point for the stream, set before the state update renders
+      messagesData.messages.forEach((m) => {
+        lastIdRef.current = Math.max(lastIdRef.current, m.id);
+      });
+      setMessages((prev) => mergeMessages(prev, messagesData.messages));
+      setOlderCursor(messagesData.next_cursor);
     } catch (error) {
       console.error('Error fetching data:', error);
     } finally {
@@ -49,8 +111,20 @@ function Chat() {
 
   const fetchMessages = async () => {
     try {
-      const messagesData = await messageAPI.get(orderId);
-      setMessages(messagesData);
+      // Only ask for what we have not seen yet
+      const messagesData = await messageAPI.get(orderId, { afterId: lastIdRef.current || undefined });
+      setMessages((prev) => mergeMessages(prev, messagesData.messages));
+    } catch (error) {
+      console.error('Error fetching messages:', error);
+    }
+  };
+
+  const fetchOlderMessages = async () => {
+    if (!olderCursor) return;
+    try {
+      const messagesData = await messageAPI.get(orderId, { cursor: olderCursor });
+      setMessages((prev) => mergeMessages(prev, messagesData.messages));
+      setOlderCursor(messagesData.next_cursor);
     } catch (error) {
       console.error('Error fetching messages:', error);
     }
@@ -68,7 +142,8 @@ function Chat() {
     try {
       await messageAPI.send(orderId, newMessage.trim());
       setNewMessage('');
-      await fetchMessages();
+      // With the stream open the new message is pushed back to us
+      if (!streamingRef.current) await fetchMessages();
     } catch (error) {
       console.error('Error sending message:', error);
       alert('ส่งข้อความไม่สำเร็จ');
@@ -116,6 +191,11 @@ function Chat() {
           </div>
         ) : (
           <>
+            {olderCursor && (
+              <button className="load-older-btn" onClick={fetchOlderMessages}>
+                โหลดข้อความก่อนหน้า
+              </button>
+            )}
             {messages.map((message) => (
               <div 
                 key={message.id} 
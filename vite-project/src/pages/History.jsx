@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import { useNavigate } from 'react-router-dom';
 import { Clock, MapPin, ChevronRight, Package, MessageCircle } from 'lucide-react';
 import { orderAPI } from '../services/api';
@@ -8,7 +8,10 @@ import '../styles/History.css';
 function History() {
   const navigate = useNavigate();
   const [orders, setOrders] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const lastEventIdRef = useRef(0);
 
   useEffect(() => {
     const userData = localStorage.getItem('user');
@@ -16,13 +19,45 @@ function History() {
       navigate('/');
       return;
     }
-    fetchOrders();
+
+    const controller = new AbortController();
+
+    // Status changes are pushed and applied in place; reconnects resume from
+    // the last event seen, so nothing is refetched
+    const listen = async () => {
+      while (!controller.signal.aborted) {
+        try {
+          await orderAPI.streamStatus(
+            lastEventIdRef.current,
+            (event) => {
+              lastEventIdRef.current = Math.max(lastEventIdRef.current, event.id);
+              setOrders((prev) => prev.map((order) => (
+                order.id === event.order_id ? { ...order, status: event.status } : order
+              )));
+            },
+            controller.signal
+          );
+        } catch (error) {
+          if (controller.signal.aborted) return;
+          console.error('Order status stream unavailable:', error);
+          return;
+        }
+      }
+    };
+
+    fetchOrders().then(() => {
+      if (!controller.signal.aborted) listen();
+    });
+
+    return () => controller.abort();
   }, [navigate]);
 
   const fetchOrders = async () => {
     try {
       const data = await orderAPI.getHistory();
-      setOrders(data);
+      lastEventIdRef.current = data.last_event_id || 0;
+      setOrders(data.orders);
+      setNextCursor(data.next_cursor);
     } catch (error) {
       console.error('Error fetching orders:', error);
     } finally {
@@ -30,6 +65,21 @@ function History() {
     }
   };
 
+  const fetchMoreOrders = async () => {
+    if (!nextCursor || loadingMore) return;
+
+    setLoadingMore(true);
+    try {
+      const data = await orderAPI.getHistory(nextCursor);
+      setOrders((prev) => [...prev, ...data.orders]);
+      setNextCursor(data.next_cursor);
+    } catch (error) {
+      console.error('Error fetching orders:', error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const getStatusColor = (status) => {
     switch (status) {
       case 'pending': return 'status-pending';
@@ -151,6 +201,15 @@ function History() {
                 </div>
               </div>
             ))}
+            {nextCursor && (
+              <button
+                className="browse-btn load-more-btn"
+                onClick={fetchMoreOrders}
+                disabled={loadingMore}
+              >
+                {loadingMore ? 'กำลังโหลด...' : 'โหลดเพิ่มเติม'}
+              </button>
+            )}
           </div>
         )}
       </main>
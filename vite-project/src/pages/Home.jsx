@@ -1,7 +1,7 @@
 import React, { useState, useEffect } from 'react';
 import { useNavigate } from 'react-router-dom';
-import { MapPin, Clock, ChevronRight, Search, Store } from 'lucide-react';
-import { restaurantAPI } from '../services/api';
+import { MapPin, Clock, ChevronRight, Search, Store, UtensilsCrossed } from 'lucide-react';
+import { restaurantAPI, searchAPI } from '../services/api';
 import Navbar from '../components/ui/navbar';
 import '../styles/Home.css';
 
@@ -10,6 +10,8 @@ function Home() {
   const [restaurants, setRestaurants] = useState([]);
   const [loading, setLoading] = useState(true);
   const [searchTerm, setSearchTerm] = useState('');
+  const [searchResults, setSearchResults] = useState(null);
+  const [openNow, setOpenNow] = useState(true);
   const [user, setUser] = useState(null);
 
   useEffect(() => {
@@ -22,11 +24,12 @@ function Home() {
     }
 
     fetchData();
-  }, [navigate]);
+  }, [navigate, openNow]);
 
   const fetchData = async () => {
     try {
-      const restaurantsData = await restaurantAPI.getAll();
+      // The server filters by opening hours, so closed vendors are not sent
+      const restaurantsData = await restaurantAPI.getAll({ openNow });
       setRestaurants(restaurantsData);
     } catch (error) {
       console.error('Error fetching data:', error);
@@ -35,10 +38,37 @@ function Home() {
     }
   };
 
-  const filteredRestaurants = restaurants.filter(restaurant =>
-    restaurant.name.toLowerCase().includes(searchTerm.toLowerCase()) ||
-    (restaurant.location && restaurant.location.toLowerCase().includes(searchTerm.toLowerCase()))
-  );
+  // Search runs on the server (Thai-aware substring index); debounced so
+  // typing does not send a request per keystroke
+  useEffect(() => {
+    const query = searchTerm.trim();
+    if (!query) {
+      setSearchResults(null);
+      return;
+    }
+
+    let cancelled = false;
+    const timer = setTimeout(async () => {
+      try {
+        const data = await searchAPI.search(query);
+        if (!cancelled) setSearchResults(data);
+      } catch (error) {
+        console.error('Error searching:', error);
+      }
+    }, 300);
+
+    return () => {
+      cancelled = true;
+      clearTimeout(timer);
+    };
+  }, [searchTerm]);
+
+  // Search results carry no menu_count; take it from the full listing
+  const menuCounts = new Map(restaurants.map((r) => [r.id, r.menu_count]));
+  const filteredRestaurants = searchResults
+    ? searchResults.restaurants.results.map((r) => ({ ...r, menu_count: menuCounts.get(r.id) ?? 0 }))
+    : restaurants;
+  const matchedMenuItems = searchResults ? searchResults.menu_items.results : [];
 
   const handleRestaurantClick = (restaurantId) => {
     navigate(`/restaurant/${restaurantId}`);
@@ -70,7 +100,7 @@ function Home() {
           <Search size={20} className="search-icon" />
           <input
             type="text"
-            placeholder="ค้นหาร้านอาหาร..."
+            placeholder="ค้นหาร้านอาหารหรือเมนู..."
             value={searchTerm}
             onChange={(e) => setSearchTerm(e.target.value)}
             className="search-input"
@@ -84,6 +114,12 @@ function Home() {
           <div className="section-header">
             <Store size={24} />
             <h2>ร้านที่เปิดรับหิ้ว</h2>
+            <button
+              className={`open-now-toggle ${openNow ? 'active' : ''}`}
+              onClick={() => setOpenNow((value) => !value)}
+            >
+              {openNow ? 'เปิดอยู่ตอนนี้' : 'ทั้งหมด'}
+            </button>
           </div>
 
           {filteredRestaurants.length === 0 ? (
@@ -133,6 +169,32 @@ function Home() {
             </div>
           )}
         </section>
+
+        {matchedMenuItems.length > 0 && (
+          <section className="restaurants-section">
+            <div className="section-header">
+              <UtensilsCrossed size={24} />
+              <h2>เมนูที่ตรงกัน</h2>
+            </div>
+
+            <div className="menu-results">
+              {matchedMenuItems.map((item) => (
+                <div
+                  key={item.id}
+                  className="menu-result"
+                  onClick={() => handleRestaurantClick(item.restaurant_id)}
+                >
+                  <div className="menu-result-info">
+                    <h3>{item.name}</h3>
+                    <p>{item.restaurant_name}</p>
+                  </div>
+                  <span className="menu-result-price">฿{item.price}</span>
+                  <ChevronRight size={20} className="chevron-icon" />
+                </div>
+              ))}
+            </div>
+          </section>
+        )}
       </main>
 
       <Navbar activeTab="home" />
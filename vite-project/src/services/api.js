@@ -1,13 +1,12 @@
 const API_BASE_URL = 'http://localhost:5001/api';
 
-// Helper function to make API calls
-const apiCall = async (endpoint, options = {}) => {
-  // Get user from localStorage for auth
+// Build request headers, adding X-User-Id from localStorage for auth
+const buildHeaders = (extra = {}) => {
   const user = JSON.parse(localStorage.getItem('user') || 'null');
   
   const headers = {
     'Content-Type': 'application/json',
-    ...options.headers,
+    ...extra,
   };
   
   // Only add X-User-Id if user exists and has id
@@ -15,6 +14,13 @@ const apiCall = async (endpoint, options = {}) => {
     headers['X-User-Id'] = String(user.id);
   }
   
+  return headers;
+};
+
+// Helper function to make API calls
+const apiCall = async (endpoint, options = {}) => {
+  const headers = buildHeaders(options.headers);
+  
   const config = {
     ...options,
     mode: 'cors',
@@ -31,6 +37,67 @@ const apiCall = async (endpoint, options = {}) => {
   return data;
 };
 
+// Read a server-sent event stream with fetch (EventSource cannot send the
+// X-User-Id header). Calls onEvent({ event, id, data }) for every event and
+// resolves when the server closes the stream; rejects if it cannot connect.
+const streamEvents = async (endpoint, onEvent, signal) => {
+  const response = await fetch(`${API_BASE_URL}${endpoint}`, {
+    mode: 'cors',
+    headers: buildHeaders({ Accept: 'text/event-stream' }),
+    signal,
+  });
+
+  if (!response.ok || !response.body) {
+    throw new Error('Event stream unavailable');
+  }
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (done) return;
+    buffer += decoder.decode(value, { stream: true });
+
+    let boundary;
+    while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+      const block = buffer.slice(0, boundary);
+      buffer = buffer.slice(boundary + 2);
+
+      const event = { event: 'message', id: null, data: '' };
+      block.split('\n').forEach((line) => {
+        // Lines starting with ':' are keepalive comments
+        if (!line || line.startsWith(':')) return;
+        const colon = line.indexOf(':');
+        const field = colon === -1 ? line : line.slice(0, colon);
+        let fieldValue = colon === -1 ? '' : line.slice(colon + 1);
+        if (fieldValue.startsWith(' ')) fieldValue = fieldValue.slice(1);
+
+        if (field === 'data') event.data += event.data ? `\n${fieldValue}` : fieldValue;
+        else if (field === 'event') event.event = fieldValue;
+        else if (field === 'id') event.id = fieldValue;
+      });
+
+      if (event.data) {
+        onEvent({ ...event, data: JSON.parse(event.data) });
+      }
+    }
+  }
+};
+
+// Build "?key=value" from params, skipping empty values
+const toQuery = (params = {}) => {
+  const query = new URLSearchParams();
+  Object.entries(params).forEach(([key, value]) => {
+    if (value !== undefined && value !== null && value !== '') {
+      query.append(key, value);
+    }
+  });
+  const str = query.toString();
+  return str ? `?${str}` : '';
+};
+
 // Auth APIs
 export const authAPI = {
   login: (username, password) => 
@@ -48,8 +115,10 @@ export const authAPI = {
 
 // Restaurant APIs
 export const restaurantAPI = {
-  getAll: () => 
-    apiCall('/restaurants'),
+  // openNow limits the list to restaurants taking orders right now;
+  // openAt ('HH:MM') to those taking orders at that time
+  getAll: ({ openNow, openAt } = {}) => 
+    apiCall(`/restaurants${toQuery({ open_now: openNow ? 1 : undefined, open_at: openAt })}`),
 
   getById: (id) => 
     apiCall(`/restaurants/${id}`),
@@ -59,6 +128,20 @@ export const restaurantAPI = {
       method: 'POST',
       body: JSON.stringify(data),
     }),
+
+  // Owner sales report: daily orders/revenue and top items between from and
+  // to ('YYYY-MM-DD', inclusive; default the last 30 days)
+  getAnalytics: (id, { from, to, limit } = {}) => 
+    apiCall(`/restaurants/${id}/analytics${toQuery({ from, to, limit })}`),
+};
+
+// Search API
+export const searchAPI = {
+  // Ranked server-side search over restaurants and menu items. type is
+  // 'all', 'restaurants' or 'menu_items'; cursor needs a single type.
+  // Returns { restaurants: { results, next_cursor }, menu_items: { ... } }
+  search: (q, { type, limit, cursor } = {}) => 
+    apiCall(`/search${toQuery({ q, type, limit, cursor })}`),
 };
 
 // Menu APIs
@@ -71,6 +154,30 @@ export const menuAPI = {
       method: 'POST',
       body: JSON.stringify(data),
     }),
+
+  // Owner bulk import. items is an array of { action, id, name, price, ... }
+  // with action 'create', 'update', 'unavailable' or 'delete', or a CSV File
+  // with those columns. All or nothing: a 400 carries errors per row
+  bulkImport: async (restaurantId, items) => {
+    const isFile = typeof Blob !== 'undefined' && items instanceof Blob;
+    const body = new FormData();
+    if (isFile) body.append('file', items);
+    const headers = buildHeaders();
+    if (isFile) delete headers['Content-Type'];
+    const response = await fetch(`${API_BASE_URL}/restaurants/${restaurantId}/menu/bulk`, {
+      method: 'POST',
+      mode: 'cors',
+      headers,
+      body: isFile ? body : JSON.stringify(items),
+    });
+    const data = await response.json();
+    if (!response.ok) {
+      const error = new Error(data.error || 'Import failed');
+      error.rows = data.errors || [];
+      throw error;
+    }
+    return data;
+  },
 };
 
 // Cart APIs
@@ -78,6 +185,10 @@ export const cartAPI = {
   get: () => 
     apiCall('/cart'),
 
+  // Item count and totals maintained server-side; does not read the cart rows
+  summary: () => 
+    apiCall('/cart/summary'),
+
   add: (menuItemId, quantity = 1, note = '') => 
     apiCall('/cart', {
       method: 'POST',
@@ -93,17 +204,42 @@ export const cartAPI = {
   remove: (itemId) => 
     apiCall(`/cart/${itemId}`, { method: 'DELETE' }),
 
+  // Apply several add/set/remove operations in one request; returns the cart
+  batch: (operations) => 
+    apiCall('/cart', {
+      method: 'PATCH',
+      body: JSON.stringify({ operations }),
+    }),
+
   clear: () => 
     apiCall('/cart/clear', { method: 'DELETE' }),
 };
 
 // Order APIs
 export const orderAPI = {
-  create: () => 
-    apiCall('/orders', { method: 'POST' }),
+  // expectedTotal is the total the user saw; the server rejects checkout
+  // with 409 if prices or availability changed since
+  create: (expectedTotal) => 
+    apiCall('/orders', {
+      method: 'POST',
+      body: JSON.stringify({ expected_total: expectedTotal }),
+    }),
+
+  // Returns { orders, next_cursor }; pass next_cursor back to load the next page.
+  // The first page also has last_event_id, the resume point for streamStatus
+  getHistory: (cursor, limit) => 
+    apiCall(`/orders/history${toQuery({ cursor, limit })}`),
 
-  getHistory: () => 
-    apiCall('/orders/history'),
+  // Pushes { id, order_id, status, created_at } for status changes of the
+  // user's orders after afterId; resolves when the server ends the stream
+  streamStatus: (afterId, onStatus, signal) => 
+    streamEvents(
+      `/orders/stream${toQuery({ after_id: afterId })}`,
+      (event) => {
+        if (event.event === 'status') onStatus(event.data);
+      },
+      signal,
+    ),
 
   getById: (orderId) => 
     apiCall(`/orders/${orderId}`),
@@ -113,12 +249,59 @@ export const orderAPI = {
       method: 'PUT',
       body: JSON.stringify({ status }),
     }),
+
+  // Owner queue for a restaurant, oldest first. statuses is an array;
+  // since/until are ISO timestamps. Returns { orders, next_cursor }
+  getQueue: (restaurantId, { statuses, since, until, cursor, limit } = {}) => 
+    apiCall(`/restaurants/${restaurantId}/orders${toQuery({
+      status: statuses && statuses.join(','), since, until, cursor, limit,
+    })}`),
+
+  // Moves several orders to one status at once; with fromStatus the server
+  // answers 409 if any of them has left that status in the meantime
+  bulkUpdateStatus: (orderIds, status, fromStatus) => 
+    apiCall('/orders/status', {
+      method: 'PUT',
+      body: JSON.stringify({ order_ids: orderIds, status, from_status: fromStatus }),
+    }),
+
+  // Owner's orders with their items as a file, format 'csv' or 'ndjson',
+  // same filters as getQueue. Resolves to a Blob (a plain link could not
+  // send the X-User-Id header)
+  exportOrders: async (restaurantId, { format = 'csv', statuses, since, until } = {}) => {
+    const response = await fetch(`${API_BASE_URL}/restaurants/${restaurantId}/orders/export${toQuery({
+      format, status: statuses && statuses.join(','), since, until,
+    })}`, { mode: 'cors', headers: buildHeaders() });
+    if (!response.ok) {
+      const data = await response.json().catch(() => ({}));
+      throw new Error(data.error || 'Export failed');
+    }
+    return response.blob();
+  },
 };
 
 // Message APIs
 export const messageAPI = {
-  get: (orderId) => 
-    apiCall(`/messages/${orderId}`),
+  // Returns { messages, next_cursor, has_more }. Pass cursor to load older
+  // messages, or afterId to fetch only messages newer than the last one seen
+  get: (orderId, { cursor, limit, afterId } = {}) => 
+    apiCall(`/messages/${orderId}${toQuery({ cursor, limit, after_id: afterId })}`),
+
+  markRead: (orderId) => 
+    apiCall(`/messages/${orderId}/read`, { method: 'POST' }),
+
+  unreadCount: () => 
+    apiCall('/messages/unread-count'),
+
+  // Push channel: calls onMessage for each new message after afterId
+  stream: (orderId, afterId, onMessage, signal) =>
+    streamEvents(
+      `/messages/${orderId}/stream${toQuery({ after_id: afterId })}`,
+      (event) => {
+        if (event.event === 'message') onMessage(event.data);
+      },
+      signal,
+    ),
 
   send: (orderId, content) => 
     apiCall(`/messages/${orderId}`, {
@@ -142,6 +325,7 @@ export const userAPI = {
 export default {
   auth: authAPI,
   restaurant: restaurantAPI,
+  search: searchAPI,
   menu: menuAPI,
   cart: cartAPI,
   order: orderAPI,